@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Cache backends: per-call latency and hit rate across replicas (no network).
+
+    python benchmarks/cache_backends.py [--queries 200] [--replicas 4]
+
+Times get and set of a typical DPD answer (30 search results as JSON) on
+each backend: in-process memory, SQLite in WAL mode (a temporary file)
+and the Redis-protocol client against the local stand-in server. Then
+spreads a stream of repeated queries round-robin over --replicas response
+caches, as a load balancer would, and reports how many were hits with
+in-process caches only against a shared backend.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from medschedule.cachestore import KVBackend, LocalKVServer, MemoryBackend, SqliteBackend  # noqa: E402
+from medschedule.dpd import ResponseCache, decode_results, encode_results  # noqa: E402
+from medschedule.records import SearchResult  # noqa: E402
+
+
+def answer(i):
+    return tuple(
+        SearchResult(f"PRODUCT {i} {n}", 'COMPANY', 'Health Canada', 'Health Canada API', str(n), f"{n:08d}")
+        for n in range(30)
+    )
+
+
+def time_calls(backend, rounds=500):
+    import json
+
+    value = json.dumps([time.time(), encode_results(answer(0))]).encode()
+    started = time.perf_counter()
+    for i in range(rounds):
+        backend.set(f"bench:{i}", value, 60)
+    set_us = (time.perf_counter() - started) / rounds * 1e6
+    started = time.perf_counter()
+    for i in range(rounds):
+        backend.get(f"bench:{i}")
+    get_us = (time.perf_counter() - started) / rounds * 1e6
+    return get_us, set_us
+
+
+def hit_rate(queries, replicas, backend):
+    caches = [
+        ResponseCache(backend=backend, namespace='bench-hits', encode=encode_results, decode=decode_results)
+        for _ in range(replicas)
+    ]
+    hits = 0
+    for i, query in enumerate(queries):
+        cache = caches[i % replicas]
+        if cache.get('en', query) is not None:
+            hits += 1
+        else:
+            cache.put('en', query, answer(query))
+    return hits / len(queries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache backend latency and cross-replica hit rate")
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--replicas', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    server = LocalKVServer().start()
+    with tempfile.TemporaryDirectory() as directory:
+        backends = [
+            ('memory', MemoryBackend(max_entries=1000)),
+            ('sqlite-wal', SqliteBackend(os.path.join(directory, 'cache.db'))),
+            ('kv', KVBackend(server.host, server.port)),
+        ]
+        print(f"{'backend':<12} {'get us':>8} {'set us':>8}")
+        for name, backend in backends:
+            get_us, set_us = time_calls(backend)
+            print(f"{name:<12} {get_us:8.0f} {set_us:8.0f}")
+
+        # A popular head and a long tail, like real searches
+        rng = random.Random(1)
+        queries = [min(int(rng.paretovariate(1.2)), 60) for _ in range(args.queries)]
+        print(f"\nhit rate over {args.queries} queries on {args.replicas} replicas")
+        print(f"{'in-process only':<16} {hit_rate(queries, args.replicas, None):6.0%}")
+        print(f"{'shared sqlite':<16} {hit_rate(queries, args.replicas, backends[1][1]):6.0%}")
+        print(f"{'shared kv':<16} {hit_rate(queries, args.replicas, backends[2][1]):6.0%}")
+    server.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Daily-limit guardrail cost over long schedule horizons.
+
+    python benchmarks/dose_guardrails.py [--meds 40] [--days 365] [--runs 50]
+
+Builds a medication list of ingredients that have a maximum daily dose,
+with every third entry on a weekly taper and a few brand/generic pairs
+that add up on the same ingredient, then times check_daily_limits() (the
+vectorized meds x days x slots pass) against a per-day loop over
+get_dose_for_day(), the way the PDF walks the calendar.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from medschedule.equivalents import load_equivalence_index  # noqa: E402
+from medschedule.guardrails import (  # noqa: E402
+    TIME_SLOTS, check_daily_limits, load_max_dose_table, unit_factor,
+)
+from medschedule.schedule import get_dose_for_day  # noqa: E402
+
+SLOT_CHOICES = [['Morning'], ['Morning', 'Bedtime'], ['Morning', 'Noon', 'Evening'], list(TIME_SLOTS)]
+
+
+def sample_meds(count, days):
+    table = load_max_dose_table()
+    ingredients = sorted(ingredient for ingredient, (_, unit) in table.items() if unit == 'mg')
+    meds = []
+    for i in range(count):
+        # Wrap around so some ingredients appear twice and their entries add up
+        ingredient = ingredients[(i * 7) % len(ingredients)] if i < count - 4 else ingredients[i % 4]
+        max_daily = table[ingredient][0]
+        med = {
+            'id': f"bench{i:04d}", 'name': ingredient, 'strength_value': max_daily / 4,
+            'strength_unit': 'mg', 'time_slots': SLOT_CHOICES[i % len(SLOT_CHOICES)],
+            'variable_dosing': False, 'dose_schedule': None,
+        }
+        if i % 3 == 0:
+            steps = [{'day': day, 'dose': max_daily * (1.2 - day / days)} for day in range(0, days, 7)]
+            med['variable_dosing'] = True
+            med['dose_schedule'] = {'type': 'gradual', 'steps': steps}
+        meds.append(med)
+    return meds
+
+
+def loop_check(meds, days, table, index):
+    """Reference implementation: one Python loop per day, slot and entry."""
+    totals = {}
+    for med in meds:
+        ingredient = index.therapy_keys(med['name'])[0]
+        if ingredient not in table or unit_factor(med['strength_unit'], table[ingredient][1]) is None:
+            continue
+        row = totals.setdefault(ingredient, [0.0] * days)
+        factor = unit_factor(med['strength_unit'], table[ingredient][1])
+        for day in range(days):
+            row[day] += get_dose_for_day(med, day) * len(med['time_slots']) * factor
+    return {ingredient for ingredient, row in totals.items() if max(row) > table[ingredient][0]}
+
+
+def median_ms(fn, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vectorized vs per-day dose guardrail checks")
+    parser.add_argument('--meds', type=int, default=40)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    table = load_max_dose_table()
+    index = load_equivalence_index()
+    meds = sample_meds(args.meds, args.days)
+
+    violations = check_daily_limits(meds, args.days, table, index)
+    assert {v.ingredient for v in violations} == loop_check(meds, args.days, table, index)
+
+    vector_ms = median_ms(lambda: check_daily_limits(meds, args.days, table, index), args.runs)
+    loop_ms = median_ms(lambda: loop_check(meds, args.days, table, index), max(1, args.runs // 10))
+
+    print(f"{args.meds} medications x {args.days} days x {len(TIME_SLOTS)} slots, "
+          f"{len(violations)} ingredients over their maximum")
+    print(f"{'vectorized':<12} {vector_ms:8.2f} ms")
+    print(f"{'per-day loop':<12} {loop_ms:8.2f} ms ({loop_ms / vector_ms:.0f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+DPD fan-out search latency against simulated endpoints (no network).
+
+    python benchmarks/dpd_fanout.py [--brand-ms 800] [--ingredient-ms 300] [--product-ms 150] [--brand-hits 40]
+
+Replaces requests.get with endpoints that sleep for the given latencies,
+then times search_health_canada_api() for a name (brand name and
+ingredient lookups, plus product lookups for the ingredient's drug codes)
+and for a DIN, against the sum of the same calls made one after another.
+With --brand-hits at or above the result cap, the search returns with the
+brand-name lookup and doesn't wait for the ingredient's products. Last,
+resolves a list of --dins DINs (bounded concurrency) against one lookup
+after another.
+"""
+
+import argparse
+import os
+import sys
+import time
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests  # noqa: E402
+
+from medschedule import dpd  # noqa: E402
+from medschedule.din import DinIndex  # noqa: E402
+
+
+class Response:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def simulated_get(args):
+    def get(url, params, timeout, headers):
+        if 'brandname' in params:
+            time.sleep(args.brand_ms / 1000)
+            return Response([
+                {'drug_code': code, 'brand_name': f"{params['brandname']} {code}", 'company_name': 'BRAND CO',
+                 'drug_identification_number': f"{code:08d}"}
+                for code in range(args.brand_hits)
+            ])
+        if 'ingredientname' in params:
+            time.sleep(args.ingredient_ms / 1000)
+            return Response([{'drug_code': 1000 + i, 'ingredient_name': params['ingredientname']} for i in range(12)])
+        if 'din' in params:
+            time.sleep(args.product_ms / 1000)
+            return Response([{'drug_code': 7, 'brand_name': 'DIN MATCH', 'company_name': '',
+                              'drug_identification_number': params['din']}])
+        time.sleep(args.product_ms / 1000)
+        return Response({'drug_code': params['id'], 'brand_name': f"GENERIC {params['id']}", 'company_name': ''})
+    return get
+
+
+def timed_search(query):
+    dpd.RESPONSE_CACHE.clear()
+    started = time.perf_counter()
+    # A fresh in-memory DIN index, so the DIN isn't answered from an earlier run
+    results, error = dpd.search_health_canada_api(query, dins=DinIndex(path=None))
+    return (time.perf_counter() - started) * 1000, results, error
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DPD fan-out search vs sequential lookups")
+    parser.add_argument('--brand-ms', type=float, default=800)
+    parser.add_argument('--ingredient-ms', type=float, default=300)
+    parser.add_argument('--product-ms', type=float, default=150)
+    parser.add_argument('--brand-hits', type=int, default=10)
+    parser.add_argument('--dins', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    products = min(12, dpd.INGREDIENT_PRODUCT_LIMIT)
+    sequential = {
+        'ATORVASTATIN': args.brand_ms + args.ingredient_ms + products * args.product_ms,
+        '02239940': args.product_ms + args.brand_ms,
+    }
+    print(f"{'query':<14} {'fan-out ms':>10} {'sequential ms':>14} {'results':>8}")
+    with mock.patch.object(requests, 'get', simulated_get(args)):
+        for query, sequential_ms in sequential.items():
+            elapsed, results, error = timed_search(query)
+            print(f"{query:<14} {elapsed:10.0f} {sequential_ms:14.0f} {len(results):8}  {error or ''}")
+
+        din_list = [f"{2230000 + i:08d}" for i in range(args.dins)]
+        started = time.perf_counter()
+        resolved = dpd.resolve_dins(din_list, dins=DinIndex(path=None))
+        elapsed = (time.perf_counter() - started) * 1000
+        found = sum(product is not None for product in resolved.values())
+        print(f"{f'{args.dins} DINs':<14} {elapsed:10.0f} {args.dins * args.product_ms:14.0f} {found:8}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Full-app rerun vs fragment-scoped rerun cost.
+
+    python benchmarks/fragment_rerun.py [--meds 30] [--runs 10]
+
+Seeds a session with a medication list and a selected medication, then
+compares a full script rerun (what every interaction cost before the UI was
+split into st.fragment sections) with a rerun scoped to each fragment:
+the search card, the dose/times form and the medication list.
+"""
+
+import argparse
+import functools
+import os
+import statistics
+import sys
+import time
+
+from rerun_payload import ROOT, PayloadRecorder, sample_med_list
+
+FRAGMENTS = ('add_medication_card', 'medication_form', 'medication_list')
+
+
+def fragment_ids(at):
+    """Map fragment function names to the ids Streamlit registered for them."""
+    ids = {}
+    for fragment_id, wrapped in at._fragment_storage._fragments.items():
+        for cell in wrapped.__closure__ or ():
+            name = getattr(cell.cell_contents, '__name__', None)
+            if name in FRAGMENTS:
+                ids[name] = fragment_id
+    return ids
+
+
+def timed_reruns(at, recorder, runs, fragment_id=None):
+    """Median wall time (ms) and payload bytes of `runs` reruns, optionally fragment-scoped."""
+    from streamlit.testing.v1 import local_script_runner
+
+    original = local_script_runner.RerunData
+    if fragment_id:
+        local_script_runner.RerunData = functools.partial(
+            original, fragment_id_queue=[fragment_id], is_fragment_scoped_rerun=True
+        )
+    try:
+        timings = []
+        for _ in range(runs):
+            recorder.reset()
+            started = time.perf_counter()
+            at.run()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        local_script_runner.RerunData = original
+    return statistics.median(timings), recorder.summary()[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-app vs fragment-scoped rerun cost")
+    parser.add_argument('--meds', type=int, default=30)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    from streamlit.testing.v1 import AppTest
+
+    recorder = PayloadRecorder()
+    recorder.install()
+
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=120)
+    at.run()
+    at.session_state.med_list = sample_med_list(args.meds)
+    at.session_state.selected_medication = {'brand_name': 'ATORVASTATIN', 'source': 'database'}
+    at.run()
+    if at.exception:
+        print(f"app raised: {[e.value for e in at.exception]}")
+        return 1
+
+    ids = fragment_ids(at)
+    full_ms, full_bytes = timed_reruns(at, recorder, args.runs)
+
+    print(f"medications: {args.meds}, median of {args.runs} reruns")
+    print(f"{'scope':<22} {'wall ms':>9} {'bytes':>9} {'speedup':>8}")
+    print(f"{'full app':<22} {full_ms:9.1f} {full_bytes:9,} {'1.0x':>8}")
+    for name in FRAGMENTS:
+        if name not in ids:
+            print(f"{name:<22} not registered in this run")
+            continue
+        ms, payload = timed_reruns(at, recorder, args.runs, ids[name])
+        print(f"{name:<22} {ms:9.1f} {payload:9,} {full_ms / ms:7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
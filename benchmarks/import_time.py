@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Import-time budget for the headless core package.
+
+    python benchmarks/import_time.py [--budget-ms 25] [--runs 5]
+
+Imports the core modules in a fresh interpreter under `-X importtime`, prints the
+slowest entries and fails (exit 1) if the best-of-N cumulative time exceeds the
+budget or if Streamlit, requests or fpdf were pulled in.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CORE_IMPORT = (
+    "import sys, medschedule, medschedule.database, medschedule.search, medschedule.schedule; "
+    "print(','.join(m for m in ('streamlit', 'requests', 'fpdf') if m in sys.modules))"
+)
+
+
+def measure_once():
+    """Return ({module: (self_us, cumulative_us)}, forbidden modules loaded) for one cold import."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CORE_IMPORT],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Top-level imports are indented by a single space; nested ones by more
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    loaded = [m for m in proc.stdout.strip().split(',') if m]
+    return timings, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=25.0)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    best_total = None
+    best_timings = None
+    loaded = []
+    for _ in range(args.runs):
+        timings, loaded = measure_once()
+        total = sum(
+            cumulative_us for name, (_, cumulative_us, depth) in timings.items()
+            if depth == 0 and name.startswith('medschedule')
+        )
+        if best_total is None or total < best_total:
+            best_total, best_timings = total, timings
+
+    print(f"medschedule core import: {best_total / 1000:.2f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    ranked = sorted(best_timings.items(), key=lambda kv: kv[1][0], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us, _) in ranked:
+        print(f"{self_us / 1000:9.2f} {cumulative_us / 1000:9.2f}  {name}")
+
+    failed = False
+    if loaded:
+        print(f"FAIL: core import loaded {', '.join(loaded)}")
+        failed = True
+    if best_total / 1000 > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
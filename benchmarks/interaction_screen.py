@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Interaction screening cost: full list screen and incremental add.
+
+    python benchmarks/interaction_screen.py [--meds 40] [--runs 200]
+
+Builds a medication list from catalogue names (brands and generics mixed,
+so equivalents resolve to shared ingredients), then times screening the
+whole list from scratch and adding one more entry to an already screened
+list. Both use the shared, already-loaded pair table.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from medschedule.database import MEDICATION_DATABASE  # noqa: E402
+from medschedule.equivalents import load_equivalence_index  # noqa: E402
+from medschedule.interactions import (  # noqa: E402
+    InteractionScreen, load_interaction_table, screen_medications,
+)
+
+# Commonly co-prescribed names with several known interactions among them
+SEED_NAMES = [
+    'ELIQUIS', 'ADVIL', 'CIPRALEX', 'TRAMADOL', 'OXYCONTIN', 'ATIVAN', 'LYRICA', 'ALTACE',
+    'ALDACTONE', 'LITHIUM', 'LIPITOR', 'BIAXIN', 'SYNTHROID', 'CALCIUM CARBONATE', 'PLAVIX', 'LOSEC',
+]
+
+
+def sample_meds(count):
+    names = list(SEED_NAMES)
+    row = 0
+    while len(names) < count:
+        name = MEDICATION_DATABASE.brand_name(row)
+        if name not in names:
+            names.append(name)
+        row += 7
+    return [{'id': f"bench{i:04d}", 'name': name} for i, name in enumerate(names[:count])]
+
+
+def median_us(fn, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interaction screen: full list vs incremental add")
+    parser.add_argument('--meds', type=int, default=40)
+    parser.add_argument('--runs', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    table = load_interaction_table()
+    index = load_equivalence_index()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    meds = sample_meds(args.meds)
+    alerts = screen_medications(meds, table, index)
+    full_us = median_us(lambda: screen_medications(meds, table, index), args.runs)
+
+    base = meds[:-1]
+
+    def add_last():
+        screen = InteractionScreen()
+        for med in base:
+            screen.add(med, table, index)
+        started = time.perf_counter()
+        screen.add(meds[-1], table, index)
+        return (time.perf_counter() - started) * 1e6
+
+    add_us = statistics.median(add_last() for _ in range(args.runs))
+
+    pairs = args.meds * (args.meds - 1) // 2
+    print(f"table: {len(table)} pairs, loaded with the equivalence index in {load_ms:.1f} ms")
+    print(f"list: {args.meds} medications ({pairs} pairs), {len(alerts)} alerts")
+    print(f"{'full screen':<18} {full_us:9.1f} us")
+    print(f"{'incremental add':<18} {add_us:9.1f} us")
+    for alert in alerts[:5]:
+        print(f"  {alert.severity:<9} {alert.first_name} + {alert.second_name}: {alert.description}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
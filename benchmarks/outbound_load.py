@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Health Canada traffic under a burst of sessions (simulated endpoint, no network).
+
+    python benchmarks/outbound_load.py [--sessions 20] [--heavy-dins 60] [--latency-ms 200]
+
+Starts --sessions sessions at once, each searching a name (a fan-out of
+brand, ingredient and product lookups), plus one session resolving a
+list of --heavy-dins DINs, against an endpoint that answers in
+--latency-ms. Runs once with the outbound scheduler and once with it
+disabled (unbounded), and reports the peak number of simultaneous
+connections, the p95 and max search latency, and the scheduler's queue
+depth and wait times.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests  # noqa: E402
+
+from medschedule import dpd  # noqa: E402
+from medschedule.din import DinIndex  # noqa: E402
+from medschedule.outbound import OutboundScheduler  # noqa: E402
+
+
+class Response:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class Endpoint:
+    """Answers every lookup after a fixed latency and counts open connections."""
+
+    def __init__(self, latency_ms):
+        self.latency = latency_ms / 1000
+        self.open = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params, timeout, headers):
+        with self._lock:
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+        try:
+            time.sleep(self.latency)
+            if 'ingredientname' in params:
+                return Response([{'drug_code': 1000 + i} for i in range(4)])
+            if 'id' in params:
+                return Response({'drug_code': params['id'], 'brand_name': f"GENERIC {params['id']}", 'company_name': ''})
+            key = params.get('brandname') or params.get('din')
+            return Response([{'drug_code': key, 'brand_name': f"BRAND {key}", 'company_name': '',
+                              'drug_identification_number': params.get('din', '')}])
+        finally:
+            with self._lock:
+                self.open -= 1
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[int(fraction * (len(values) - 1))] if values else 0.0
+
+
+def run(args, scheduler):
+    endpoint = Endpoint(args.latency_ms)
+    latencies = []
+    lock = threading.Lock()
+
+    def search(i):
+        started = time.perf_counter()
+        dpd.search_health_canada_api(f"QUERY{i}", cache=None, dins=DinIndex(path=None))
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    def heavy():
+        dpd.resolve_dins([f"{3000000 + i:08d}" for i in range(args.heavy_dins)], dins=DinIndex(path=None))
+
+    threads = [threading.Thread(target=heavy)]
+    threads += [threading.Thread(target=search, args=(i,)) for i in range(args.sessions)]
+    started = time.perf_counter()
+    with mock.patch.object(requests, 'get', endpoint.get), mock.patch.object(dpd, 'OUTBOUND', scheduler):
+        threads[0].start()
+        time.sleep(0.05)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return endpoint.peak, latencies, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Outbound scheduler under a burst of sessions")
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--heavy-dins', type=int, default=60)
+    parser.add_argument('--latency-ms', type=float, default=200)
+    args = parser.parse_args(argv)
+
+    unbounded = OutboundScheduler(rate=float('inf'), burst=float('inf'), max_concurrent=float('inf'))
+    scheduled = OutboundScheduler()
+    print(f"{'':<11} {'peak conns':>10} {'p95 search s':>12} {'max search s':>12} {'total s':>8}")
+    for label, scheduler in (('unbounded', unbounded), ('scheduled', scheduled)):
+        peak, latencies, total = run(args, scheduler)
+        print(f"{label:<11} {peak:10} {percentile(latencies, 0.95):12.2f} {max(latencies):12.2f} {total:8.2f}")
+    stats = scheduled.stats()
+    print(f"scheduler: {stats['requests']} requests, peak queue {stats['peak_queued']}, "
+          f"wait mean {stats['mean_wait']:.2f}s p95 {stats['p95_wait']:.2f}s max {stats['max_wait']:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
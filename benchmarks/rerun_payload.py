@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Per-rerun payload and wall time of app.py.
+
+    python benchmarks/rerun_payload.py [--meds 30] [--runs 5]
+
+Runs the app through Streamlit's AppTest harness, seeds the session with a
+medication list, then reruns it and records the serialized size of every
+ForwardMsg the script sends to the browser. Reports bytes and messages per
+rerun, the largest deltas, and rerun wall time.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def sample_med_list(count):
+    """A realistic long-term-care list: mixed slots, a few tapers."""
+    slots = [['Morning'], ['Morning', 'Bedtime'], ['Noon'], ['Evening'], ['Morning', 'Noon', 'Evening']]
+    meds = []
+    for i in range(count):
+        meds.append({
+            'id': f"bench{i:04d}",
+            'name': f"MEDICATION {i + 1:02d}",
+            'strength_value': float(5 * (i % 8 + 1)),
+            'strength_unit': 'mg',
+            'time_slots': slots[i % len(slots)],
+            'source': 'manual' if i % 7 == 0 else 'database',
+            'added_at': '2024-01-01T08:00:00',
+            'variable_dosing': False,
+            'dose_schedule': None,
+        })
+    return meds
+
+
+class PayloadRecorder:
+    """Counts bytes of ForwardMsgs enqueued by the script runner."""
+
+    def __init__(self):
+        self.messages = []
+
+    def install(self):
+        from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+        original = ForwardMsgQueue.enqueue
+        recorder = self
+
+        def enqueue(queue, msg):
+            recorder.messages.append(msg)
+            return original(queue, msg)
+
+        ForwardMsgQueue.enqueue = enqueue
+
+    def reset(self):
+        self.messages = []
+
+    def summary(self):
+        sizes = [(msg.ByteSize(), msg) for msg in self.messages]
+        return sum(size for size, _ in sizes), sizes
+
+
+def describe(msg):
+    if msg.WhichOneof('type') != 'delta':
+        return msg.WhichOneof('type')
+    delta = msg.delta
+    kind = delta.WhichOneof('type')
+    if kind == 'new_element':
+        element = delta.new_element
+        element_type = element.WhichOneof('type')
+        if element_type == 'markdown':
+            return f"markdown {element.markdown.body[:48]!r}"
+        return element_type
+    return kind
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-rerun payload and wall time of app.py")
+    parser.add_argument('--meds', type=int, default=30)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    from streamlit.testing.v1 import AppTest
+
+    recorder = PayloadRecorder()
+    recorder.install()
+
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=120)
+    at.run()
+    meds = sample_med_list(args.meds)
+    at.session_state.med_list = meds
+    at.run()
+
+    timings = []
+    for _ in range(args.runs):
+        recorder.reset()
+        started = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - started) * 1000)
+    if at.exception:
+        print(f"app raised: {[e.value for e in at.exception]}")
+        return 1
+
+    total, sizes = recorder.summary()
+    print(f"medications: {args.meds}")
+    print(f"per-rerun payload: {total:,} bytes in {len(sizes)} messages")
+    print(f"rerun wall time: median {sorted(timings)[len(timings) // 2]:.1f} ms, best {min(timings):.1f} ms")
+    print("largest messages:")
+    for size, msg in sorted(sizes, key=lambda s: s[0], reverse=True)[:args.top]:
+        print(f"{size:>9,}  {describe(msg)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
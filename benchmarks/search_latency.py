@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Local search latency by query length.
+
+    python benchmarks/search_latency.py [--runs 50] [--query AM ...] [--type METOPROLOL ...]
+
+Times search_medications() on short, medium and misspelled queries (after
+one warm-up call builds the shared indexes) and prints the top hits, so a
+ranking change shows both its cost and its effect. Then replays typing
+each --type word one keystroke at a time, as the inline search sees it,
+with a full lookup and ranking per keystroke vs search_rows() (prefix
+table for 1-3 characters) vs IncrementalSearch vs the whole local-first
+SearchPipeline the inline search runs (local and cached stages; no
+network).
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from medschedule.database import MEDICATION_DATABASE  # noqa: E402
+from medschedule.pipeline import SearchPipeline  # noqa: E402
+from medschedule.search import (  # noqa: E402
+    IncrementalSearch, load_prefix_table, rank_hits, search_medications, search_rows,
+)
+
+DEFAULT_QUERIES = ['A', 'AM', 'MET', 'ATOR', 'INSULIN', 'LIPITOR', 'SYNTHRIOD', 'XARLETO', 'lévothyroxine']
+DEFAULT_TYPED = ['ATORVASTATIN', 'METOPROLOL', 'AMLODIPINE']
+
+
+def typing_ms(word, runs, mode):
+    """Median total ms to serve every keystroke of word, like the inline search."""
+    prefixes = [word[:n] for n in range(1, len(word) + 1)]
+    timings = []
+    for _ in range(runs):
+        state = IncrementalSearch()
+        pipeline = SearchPipeline()
+        started = time.perf_counter()
+        for prefix in prefixes:
+            if mode == 'pipeline':
+                pipeline.search(prefix, 10)
+            elif mode == 'incremental':
+                state.search(prefix, 6)
+            elif mode == 'table':
+                search_rows(prefix, 6)
+            else:
+                rank_hits(prefix, MEDICATION_DATABASE.find(prefix), 6)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local search latency by query length")
+    parser.add_argument('--runs', type=int, default=50)
+    parser.add_argument('--top', type=int, default=4)
+    parser.add_argument('--query', nargs='*', default=DEFAULT_QUERIES)
+    parser.add_argument('--type', nargs='*', default=DEFAULT_TYPED)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    search_medications('warm up')
+    print(f"index build (first call): {(time.perf_counter() - started) * 1000:.1f} ms")
+    started = time.perf_counter()
+    table = load_prefix_table()
+    print(f"prefix table build: {(time.perf_counter() - started) * 1000:.1f} ms, {len(table)} queries")
+
+    print(f"{'query':<12} {'median us':>10} {'hits':>5}  top")
+    for query in args.query:
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            results = search_medications(query)
+            timings.append((time.perf_counter() - started) * 1e6)
+        top = ', '.join(result.brand_name for result in results[:args.top])
+        print(f"{query:<12} {statistics.median(timings):10.1f} {len(results):5}  {top}")
+
+    print(f"\n{'typed':<14} {'full ms':>8} {'table ms':>9} {'incremental ms':>15} {'pipeline ms':>12}")
+    for word in args.type:
+        full = typing_ms(word.upper(), args.runs, 'full')
+        table_ms = typing_ms(word.upper(), args.runs, 'table')
+        incremental = typing_ms(word.upper(), args.runs, 'incremental')
+        pipeline = typing_ms(word.upper(), args.runs, 'pipeline')
+        print(f"{word:<14} {full:8.2f} {table_ms:9.2f} {incremental:15.2f} {pipeline:12.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
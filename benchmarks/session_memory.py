@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Per-session memory of medication and search-result data: dicts vs records.
+
+    python benchmarks/session_memory.py [--meds 40] [--api-results 30] [--local-results 20] [--sessions 200]
+
+Builds the data one session holds (med_list, api_search_results and a page of
+local search results) both as the plain dicts the app used to store and as
+medschedule.records objects, the way each is produced at runtime (API hits
+parsed from JSON, meds built from form values). Reports tracemalloc bytes per
+session and the projected total for many concurrent sessions.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from medschedule.records import Medication, SearchResult  # noqa: E402
+
+COMPANIES = ['Various', 'Pfizer', 'Apotex Inc', 'Sandoz Canada Incorporated', '']
+SLOT_CHOICES = [['Morning'], ['Morning', 'Bedtime'], ['Noon'], ['Evening'], ['Morning', 'Noon', 'Evening']]
+
+
+def api_payload(count):
+    """A DPD /drugproduct/ response body as the API returns it."""
+    return json.dumps([
+        {'brand_name': f"PRODUCT {i:03d}", 'company_name': COMPANIES[i % len(COMPANIES)], 'drug_code': 10000 + i}
+        for i in range(count)
+    ])
+
+
+def form_values(count):
+    """Values a session submits through the add-medication form (fresh strings, like widget input)."""
+    return [
+        (
+            f"MEDICATION {i:02d}", float(5 * (i % 8 + 1)), ''.join(['m', 'g']),
+            [''.join(slot) for slot in SLOT_CHOICES[i % len(SLOT_CHOICES)]],
+            ''.join(['data', 'base']), f"2024-01-01T08:{i % 60:02d}:00",
+        )
+        for i in range(count)
+    ]
+
+
+def build_dicts(args, payload, forms):
+    api = [
+        {
+            'brand_name': item['brand_name'],
+            'company': item['company_name'] or 'Health Canada DPD',
+            'category': 'Health Canada',
+            'source': 'Health Canada API',
+        }
+        for item in json.loads(payload)
+    ]
+    local = [
+        {'brand_name': f"LOCAL {i}", 'company': ''.join(['Vari', 'ous']), 'category': 'Cholesterol', 'source': 'Local Database'}
+        for i in range(args.local_results)
+    ]
+    meds = [
+        {
+            'id': f"{i:012x}", 'name': name, 'strength_value': value, 'strength_unit': unit,
+            'time_slots': list(slots), 'source': source, 'added_at': added_at,
+            'variable_dosing': False, 'dose_schedule': None,
+        }
+        for i, (name, value, unit, slots, source, added_at) in enumerate(forms)
+    ]
+    return meds, api, local
+
+
+def build_records(args, payload, forms):
+    api = [
+        SearchResult(
+            brand_name=item['brand_name'],
+            company=item['company_name'] or 'Health Canada DPD',
+            category='Health Canada',
+            source='Health Canada API',
+            drug_code=str(item['drug_code']),
+            din='',
+        )
+        for item in json.loads(payload)
+    ]
+    local = [
+        SearchResult(f"LOCAL {i}", ''.join(['Vari', 'ous']), 'Cholesterol', 'Local Database', '', '')
+        for i in range(args.local_results)
+    ]
+    meds = [
+        Medication(f"{i:012x}", name, value, unit, tuple(slots), source, added_at, False, None)
+        for i, (name, value, unit, slots, source, added_at) in enumerate(forms)
+    ]
+    return meds, api, local
+
+
+def measure(builder, args, payload, forms):
+    # Warm up once so interned strings and type caches aren't charged to the session
+    builder(args, payload, forms)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    data = builder(args, payload, forms)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del data
+    return size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-session memory: dicts vs records")
+    parser.add_argument('--meds', type=int, default=40)
+    parser.add_argument('--api-results', type=int, default=30)
+    parser.add_argument('--local-results', type=int, default=20)
+    parser.add_argument('--sessions', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    payload = api_payload(args.api_results)
+    forms = form_values(args.meds)
+    dict_bytes = measure(build_dicts, args, payload, forms)
+    record_bytes = measure(build_records, args, payload, forms)
+    saved = dict_bytes - record_bytes
+
+    print(f"per session: {args.meds} meds, {args.api_results} API results, {args.local_results} local results")
+    print(f"{'dicts':<10} {dict_bytes:>10,} bytes")
+    print(f"{'records':<10} {record_bytes:>10,} bytes")
+    print(f"{'saved':<10} {saved:>10,} bytes ({saved / dict_bytes:.0%})")
+    print(f"{args.sessions} sessions: {dict_bytes * args.sessions / 2**20:.1f} MiB -> "
+          f"{record_bytes * args.sessions / 2**20:.1f} MiB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Cold-start report for the Streamlit app.
+
+    python benchmarks/startup_report.py [--runs 3] [--json startup.json]
+
+Starts a fresh interpreter under `-X importtime`, executes app.py once through
+Streamlit's AppTest harness and reports:
+- the import-time breakdown grouped by top-level package
+- time to first render (first full script run)
+- which heavy optional modules (pandas, fpdf, requests) were loaded
+
+The JSON output is keyed by `git describe` so it can be tracked per release.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'fpdf', 'requests')
+
+RUNNER = '''
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file("app.py", default_timeout=120).run()
+t2 = time.perf_counter()
+print(json.dumps({
+    "streamlit_import_ms": (t1 - t0) * 1000,
+    "first_render_ms": (t2 - t1) * 1000,
+    "exception": [str(e.value) for e in at.exception],
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+''' % (HEAVY_MODULES,)
+
+
+def parse_importtime(stderr):
+    """Sum cumulative import time per top-level package for first-level imports."""
+    by_package = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        if len(name) - len(name.lstrip()) != 1:
+            continue  # nested import, already counted in its parent's cumulative time
+        package = name.strip().split('.')[0]
+        by_package[package] = by_package.get(package, 0) + int(cumulative_us)
+    return by_package
+
+
+def run_once():
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', RUNNER],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['imports_ms'] = {k: v / 1000 for k, v in parse_importtime(proc.stderr).items()}
+    return result
+
+
+def release_tag():
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--tags', '--always', '--dirty'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start report for app.py")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--top', type=int, default=12)
+    parser.add_argument('--json', help="append the report to this JSON file (keyed by release)")
+    args = parser.parse_args(argv)
+
+    runs = [run_once() for _ in range(args.runs)]
+    best = min(runs, key=lambda r: r['first_render_ms'])
+    if best['exception']:
+        print(f"app raised during first render: {best['exception']}")
+        return 1
+
+    release = release_tag()
+    print(f"release: {release}")
+    print(f"time to first render: {best['first_render_ms']:.0f} ms (best of {args.runs})")
+    print(f"streamlit test harness import: {best['streamlit_import_ms']:.0f} ms")
+    print(f"heavy modules loaded: {', '.join(best['loaded']) or 'none'}")
+    print(f"{'cum ms':>9}  package")
+    ranked = sorted(best['imports_ms'].items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+    for package, ms in ranked:
+        print(f"{ms:9.1f}  {package}")
+
+    if args.json:
+        history = {}
+        if os.path.exists(args.json):
+            with open(args.json, encoding='utf-8') as f:
+                history = json.load(f)
+        history[release] = {
+            'first_render_ms': round(best['first_render_ms'], 1),
+            'loaded': best['loaded'],
+            'imports_ms': {k: round(v, 1) for k, v in ranked},
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Medication Schedule Builder core package.
+Scheduling, search and PDF rendering without the Streamlit UI, for the app,
+batch workers, benchmarks and CLIs.
+
+Public names are resolved lazily so `import medschedule` stays in the
+low-millisecond range; heavy dependencies (fpdf, requests) load only when
+the function that needs them is first used.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'MEDICATION_DATABASE': 'medschedule.database',
+    'search_medications': 'medschedule.search',
+    'search_health_canada_api': 'medschedule.dpd',
+    'generate_dose_schedule': 'medschedule.schedule',
+    'get_dose_for_day': 'medschedule.schedule',
+    'generate_calendar_html': 'medschedule.preview',
+    'generate_preview_html': 'medschedule.preview',
+    'generate_pdf': 'medschedule.pdf',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'medschedule' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
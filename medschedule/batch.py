@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Headless batch PDF export.
+Renders one calendar PDF per patient medication list across a process pool:
+
+    python -m medschedule.batch patients.json rounds.csv --out-dir schedules/
+
+JSON input is a list of {"patient": ..., "medications": [...]} objects (or a
+single such object). CSV input has one row per medication with the columns
+patient, name, strength_value, strength_unit, time_slots, source; time_slots
+are separated by ';' (e.g. "Morning;Bedtime").
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+TIME_SLOTS = ['Morning', 'Noon', 'Evening', 'Bedtime']
+
+
+def normalize_medication(record):
+    """Fill in the fields generate_pdf() expects for a medication record."""
+    name = str(record.get('name') or record.get('brand_name') or '').strip()
+    if not name:
+        raise ValueError("medication is missing a name")
+
+    time_slots = record.get('time_slots') or []
+    if isinstance(time_slots, str):
+        time_slots = [slot.strip() for slot in time_slots.split(';') if slot.strip()]
+    unknown = [slot for slot in time_slots if slot not in TIME_SLOTS]
+    if unknown:
+        raise ValueError(f"{name}: unknown time slot(s) {', '.join(unknown)}")
+
+    return {
+        'name': name,
+        'strength_value': float(record.get('strength_value') or 0),
+        'strength_unit': str(record.get('strength_unit') or 'mg').strip(),
+        'time_slots': list(time_slots),
+        'source': str(record.get('source') or 'database').strip(),
+        'variable_dosing': bool(record.get('variable_dosing')),
+        'dose_schedule': record.get('dose_schedule'),
+    }
+
+
+def load_json_lists(path):
+    """Read [(patient_id, med_list), ...] from a JSON file."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [data]
+
+    default_id = os.path.splitext(os.path.basename(path))[0]
+    jobs = []
+    for i, entry in enumerate(data):
+        patient_id = str(entry.get('patient') or f"{default_id}-{i + 1}")
+        meds = [normalize_medication(m) for m in entry.get('medications', [])]
+        jobs.append((patient_id, meds))
+    return jobs
+
+
+def load_csv_lists(path):
+    """Read [(patient_id, med_list), ...] from a CSV file, grouping rows by patient."""
+    grouped = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            patient_id = (row.get('patient') or '').strip()
+            if not patient_id:
+                raise ValueError(f"{path}: row without a patient column value")
+            grouped.setdefault(patient_id, []).append(normalize_medication(row))
+    return list(grouped.items())
+
+
+def load_batch(paths):
+    """Load every input file; the format is chosen by extension."""
+    jobs = []
+    for path in paths:
+        if path.lower().endswith('.csv'):
+            jobs.extend(load_csv_lists(path))
+        else:
+            jobs.extend(load_json_lists(path))
+    return jobs
+
+
+def output_filename(patient_id, used):
+    """Filesystem-safe, unique PDF name for a patient."""
+    stem = re.sub(r'[^\w.-]+', '_', patient_id).strip('._') or 'patient'
+    name = f"{stem}.pdf"
+    suffix = 2
+    while name in used:
+        name = f"{stem}-{suffix}.pdf"
+        suffix += 1
+    used.add(name)
+    return name
+
+
+def render_to_file(med_list, out_path):
+    """Worker entry point: render one PDF and write it to disk."""
+    from medschedule.pdf import generate_pdf
+
+    pdf_bytes = generate_pdf(med_list)
+    with open(out_path, 'wb') as f:
+        f.write(pdf_bytes)
+    return len(pdf_bytes)
+
+
+def run_batch(jobs, out_dir, workers=None, max_in_flight=None):
+    """
+    Render every (patient_id, med_list) job into out_dir.
+    At most max_in_flight jobs are queued on the pool at once so large batches
+    don't hold every medication list in the executor's queue.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    os.makedirs(out_dir, exist_ok=True)
+
+    used_names = set()
+    pending_jobs = iter(jobs)
+    in_flight = {}
+    written = []
+    failed = []
+    total_bytes = 0
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(in_flight) < max_in_flight:
+                job = next(pending_jobs, None)
+                if job is None:
+                    break
+                patient_id, med_list = job
+                out_path = os.path.join(out_dir, output_filename(patient_id, used_names))
+                in_flight[pool.submit(render_to_file, med_list, out_path)] = (patient_id, out_path)
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                patient_id, out_path = in_flight.pop(future)
+                try:
+                    total_bytes += future.result()
+                    written.append(out_path)
+                except Exception as e:
+                    failed.append((patient_id, str(e)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'documents': len(written),
+        'failed': failed,
+        'bytes': total_bytes,
+        'seconds': elapsed,
+        'docs_per_sec': len(written) / elapsed if elapsed > 0 else 0.0,
+        'workers': workers,
+        'paths': written,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m medschedule.batch',
+        description="Render medication calendar PDFs for many patients in parallel."
+    )
+    parser.add_argument('inputs', nargs='+', help="JSON or CSV medication list files")
+    parser.add_argument('--out-dir', default='schedules', help="directory for the generated PDFs")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="jobs queued at once (default: 2 x workers)")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_batch(args.inputs)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    summary = run_batch(jobs, args.out_dir, workers=args.workers, max_in_flight=args.max_in_flight)
+
+    for patient_id, message in summary['failed']:
+        print(f"failed: {patient_id}: {message}", file=sys.stderr)
+    print(
+        f"{summary['documents']} PDF(s) written to {args.out_dir} in {summary['seconds']:.2f}s "
+        f"({summary['docs_per_sec']:.1f} documents/sec, {summary['workers']} workers, "
+        f"{summary['bytes'] / 1024:.0f} KiB)"
+    )
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar, memory-mapped medication catalogue.
+
+The editable source is data/medications.csv; scripts/build_catalogue.py
+compiles it into data/catalogue.bin:
+
+    header     magic, version, source digest, row count, dictionary sizes, offsets
+    names      newline-separated UTF-8 brand names (one blob)
+    name_ends  uint32[rows]   end offset of each name in the blob
+    keys       newline-separated search keys of the names (medschedule.textkey)
+    key_ends   uint32[rows]   end offset of each key in the blob
+    company    uint16[rows]   index into the company dictionary
+    category   uint16[rows]   index into the category dictionary
+    dicts      company and category strings (offsets + blob)
+
+All integers are little-endian. The file is mapped read-only once per
+process and the columns are zero-copy memoryviews over the mapping, so
+every session shares the same pages and nothing is rebuilt per rerun.
+Substring search scans the keys blob with mmap.find and maps hits back
+to rows by binary search, instead of decoding every row; keys are
+computed when the binary is built, so matching is accent-, case- and
+punctuation-insensitive at no cost per query.
+"""
+
+import bisect
+import functools
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from medschedule.textkey import search_key
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+SOURCE_PATH = os.path.join(DATA_DIR, 'medications.csv')
+CATALOGUE_PATH = os.path.join(DATA_DIR, 'catalogue.bin')
+
+MAGIC = b'MSCAT'
+VERSION = 2
+# magic, version, source CSV digest, rows, companies, categories, then byte offsets of:
+# names, name_ends, keys, key_ends, company, category, company dict, category dict, end
+HEADER = struct.Struct('<5sB8sIHHIIIIIIIII')
+
+
+def source_digest(source_path=SOURCE_PATH):
+    """CRC-32 and size of the CSV; a mismatch means the binary is stale."""
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    return struct.pack('<II', zlib.crc32(data), len(data))
+
+
+def _encode_dictionary(values):
+    """Encode strings as uint32 end offsets followed by a UTF-8 blob."""
+    blob = bytearray()
+    ends = array('I')
+    for value in values:
+        blob += value.encode('utf-8')
+        ends.append(len(blob))
+    return _le_bytes(ends) + bytes(blob)
+
+
+def _le_bytes(values):
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_catalogue(source_path=SOURCE_PATH, output_path=CATALOGUE_PATH):
+    """Compile the CSV catalogue into the columnar binary format; returns the row count."""
+    import csv
+
+    with open(source_path, newline='', encoding='utf-8') as f:
+        rows = [(r['brand_name'].strip().upper(), r['company'].strip(), r['category'].strip()) for r in csv.DictReader(f)]
+
+    companies = sorted({company for _, company, _ in rows})
+    categories = sorted({category for _, _, category in rows})
+    company_ids = {value: i for i, value in enumerate(companies)}
+    category_ids = {value: i for i, value in enumerate(categories)}
+
+    names = bytearray()
+    name_ends = array('I')
+    keys = bytearray()
+    key_ends = array('I')
+    company_col = array('H')
+    category_col = array('H')
+    for brand_name, company, category in rows:
+        names += brand_name.encode('utf-8')
+        name_ends.append(len(names))
+        names += b'\n'
+        keys += search_key(brand_name).encode('utf-8')
+        key_ends.append(len(keys))
+        keys += b'\n'
+        company_col.append(company_ids[company])
+        category_col.append(category_ids[category])
+
+    sections = [
+        bytes(names),
+        _le_bytes(name_ends),
+        bytes(keys),
+        _le_bytes(key_ends),
+        _le_bytes(company_col),
+        _le_bytes(category_col),
+        _encode_dictionary(companies),
+        _encode_dictionary(categories),
+    ]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        # Keep every section 4-byte aligned so the columns can be cast in place
+        position += -position % 4
+        offsets.append(position)
+        position += len(section)
+
+    with open(output_path + '.tmp', 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, source_digest(source_path),
+            len(rows), len(companies), len(categories), *offsets, position
+        ))
+        for offset, section in zip(offsets, sections):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(section)
+    os.replace(output_path + '.tmp', output_path)
+    return len(rows)
+
+
+class Catalogue:
+    """Read-only view over a mapped catalogue file."""
+
+    def __init__(self, path=CATALOGUE_PATH):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._map)
+
+        (magic, version, self.digest, rows, n_companies, n_categories,
+         names_at, name_ends_at, keys_at, key_ends_at, company_at, category_at,
+         company_dict_at, category_dict_at, end) = HEADER.unpack_from(buf)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} medication catalogue")
+
+        self._rows = rows
+        self._names = buf[names_at:name_ends_at]
+        self._name_ends = self._column(buf, name_ends_at, rows, 'I')
+        self._keys_at, self._keys_end = keys_at, key_ends_at
+        self._keys = buf[keys_at:key_ends_at]
+        self._key_ends = self._column(buf, key_ends_at, rows, 'I')
+        self._company_ids = self._column(buf, company_at, rows, 'H')
+        self._category_ids = self._column(buf, category_at, rows, 'H')
+        # Dictionaries are tiny; decode them once (and intern, like the record types do)
+        self.companies = self._read_dictionary(buf, company_dict_at, n_companies)
+        self.categories = self._read_dictionary(buf, category_dict_at, n_categories)
+
+    @staticmethod
+    def _column(buf, offset, count, typecode):
+        size = array(typecode).itemsize
+        raw = buf[offset:offset + count * size]
+        if sys.byteorder == 'little':
+            return raw.cast(typecode)
+        values = array(typecode, raw.tobytes())
+        values.byteswap()
+        return values
+
+    def _read_dictionary(self, buf, offset, count):
+        ends = self._column(buf, offset, count, 'I')
+        blob = buf[offset + count * 4:]
+        values = []
+        start = 0
+        for end in ends:
+            values.append(sys.intern(bytes(blob[start:end]).decode('utf-8')))
+            start = end
+        return tuple(values)
+
+    def __len__(self):
+        return self._rows
+
+    def brand_name(self, i):
+        start = self._name_ends[i - 1] + 1 if i else 0
+        return bytes(self._names[start:self._name_ends[i]]).decode('utf-8')
+
+    def key(self, i):
+        """Search key of row i's brand name ('K-DUR' -> 'K DUR')."""
+        start = self._key_ends[i - 1] + 1 if i else 0
+        return bytes(self._keys[start:self._key_ends[i]]).decode('utf-8')
+
+    def company(self, i):
+        return self.companies[self._company_ids[i]]
+
+    def category(self, i):
+        return self.categories[self._category_ids[i]]
+
+    def row(self, i):
+        """Row i as a {'brand_name', 'company', 'category'} dict."""
+        return {
+            'brand_name': self.brand_name(i),
+            'company': self.company(i),
+            'category': self.category(i),
+        }
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._rows
+        if not 0 <= i < self._rows:
+            raise IndexError('catalogue index out of range')
+        return self.row(i)
+
+    def __iter__(self):
+        for i in range(self._rows):
+            yield self.row(i)
+
+    def find(self, query_key, limit=None):
+        """Row indices (ascending) whose search key contains query_key (a search_key())."""
+        needle = query_key.encode('utf-8')
+        if not needle or b'\n' in needle:
+            return []
+        # mmap.find scans the mapped keys blob in C; offsets are absolute in the file
+        base, end = self._keys_at, self._keys_end
+        hits = []
+        position = self._map.find(needle, base, end)
+        while position != -1:
+            row = bisect.bisect_left(self._key_ends, position - base + len(needle))
+            hits.append(row)
+            if limit is not None and len(hits) >= limit:
+                break
+            # Resume after this row's key; further hits inside it add nothing
+            position = self._map.find(needle, base + self._key_ends[row] + 1, end)
+        return hits
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalogue(path=CATALOGUE_PATH, source_path=SOURCE_PATH):
+    """
+    Map the catalogue once per process, rebuilding it first if it is
+    missing, older than the CSV or of another format version.
+
+    On a read-only install (site-packages, a container image) the rebuild
+    can't be written next to the CSV: a stale but readable binary is then
+    served as is, with a warning, and a missing or incompatible one is
+    built from the CSV into the temp directory instead.
+    """
+    try:
+        catalogue = Catalogue(path) if os.path.exists(path) else None
+    except ValueError:
+        catalogue = None
+    digest = source_digest(source_path)
+    if catalogue is not None and catalogue.digest == digest:
+        return catalogue
+    try:
+        build_catalogue(source_path, path)
+        return Catalogue(path)
+    except OSError as e:
+        import warnings
+
+        if catalogue is not None:
+            warnings.warn(f"{path} is older than {source_path} and can't be rebuilt ({e}); serving it as is")
+            return catalogue
+        import tempfile
+
+        fallback = os.path.join(tempfile.gettempdir(), f"medschedule-catalogue-v{VERSION}-{digest.hex()}.bin")
+        warnings.warn(f"{path} can't be written ({e}); building the catalogue in {fallback}")
+        if not os.path.exists(fallback):
+            build_catalogue(source_path, fallback)
+        return Catalogue(fallback)
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+Top prescribed medications database.
+Based on IQVIA Canada 2024 data, ClinCalc Top 300, and Health Canada data.
+
+The rows are maintained in data/medications.csv and served from the
+memory-mapped columnar catalogue (see medschedule.catalogue), which is
+mapped once per process and shared read-only by every session.
+"""
+
+from medschedule.catalogue import load_catalogue
+
+MEDICATION_DATABASE = load_catalogue()
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+DIN (Drug Identification Number) -> product index.
+
+A DIN is the 8-digit number printed on every Canadian drug label. The
+index is a dict, so resolving one is a single lookup. It is loaded once
+per process from dins.csv in the state directory (medschedule.statedir)
+and written through: every product a Health Canada lookup returns with a
+DIN is added to the dict and appended to the file, so a DIN is fetched
+from the API about once a week per deployment, not on every search. Past
+DIN_TTL_SECONDS a product is still served but looked up again in the
+background, so renamed or cancelled products don't linger.
+
+dins.csv (din, drug_code, brand_name, company, fetched_at) is created on
+the first write. Appends hold the store's file lock, so processes sharing
+the directory never interleave rows; if there's no writable directory the
+index keeps working in memory.
+"""
+
+import functools
+import os
+import threading
+import time
+
+from medschedule.records import SearchResult
+from medschedule.statedir import locked, state_path
+
+DIN_STORE_NAME = 'dins.csv'
+DIN_FIELDS = ('din', 'drug_code', 'brand_name', 'company', 'fetched_at')
+# Products older than this are served, then looked up again (renamed or cancelled products)
+DIN_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def normalize_din(text):
+    """'2239940', '02239940' or 'DIN 02239940' -> '02239940'; None if text isn't a DIN."""
+    if text is None:
+        return None
+    digits = str(text).strip()
+    if digits[:3].upper() == 'DIN':
+        digits = digits[3:].strip(' :#')
+    if not digits.isdigit() or len(digits) > 8:
+        return None
+    return digits.zfill(8)
+
+
+def split_dins(text):
+    """
+    The DINs of a pasted list (separated by commas, semicolons, spaces or
+    lines), in order and once each; [] unless every entry is a DIN.
+    """
+    dins = []
+    for token in text.replace(',', ' ').replace(';', ' ').split():
+        din = normalize_din(token)
+        if din is None:
+            return []
+        if din not in dins:
+            dins.append(din)
+    return dins
+
+
+class DinIndex:
+    """
+    Thread-safe DIN -> SearchResult map with a write-through CSV store
+    (path None: memory only).
+
+    Each entry keeps the wall-clock time it was fetched. An entry older than
+    ttl is still returned, and if the caller says how to look it up again, a
+    refresh is queued for one background worker thread (a DIN already
+    queued isn't queued again), the same stale-while-revalidate rule as
+    medschedule.dpd.ResponseCache.
+    """
+
+    def __init__(self, path=None, ttl=DIN_TTL_SECONDS, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._products = {}
+        self._fetched = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._queue = None
+        self.writable = True
+        if path and os.path.exists(path):
+            for din, (result, fetched_at) in read_dins(path).items():
+                self._products[din] = result
+                self._fetched[din] = fetched_at
+
+    def __len__(self):
+        return len(self._products)
+
+    def __contains__(self, din):
+        return normalize_din(din) in self._products
+
+    def get(self, din, revalidate=None):
+        """
+        The product with this DIN, or None if it isn't known yet. A stale
+        product is returned as is; revalidate (a callable that looks the DIN
+        up again and add()s or discard()s it, raising to keep the old one)
+        refreshes it in the background.
+        """
+        din = normalize_din(din)
+        with self._lock:
+            product = self._products.get(din)
+            if product is not None and revalidate is not None and self._is_stale(din):
+                self._schedule(din, revalidate)
+        return product
+
+    def stale(self, din):
+        """Whether the product with this DIN was fetched more than ttl ago."""
+        din = normalize_din(din)
+        with self._lock:
+            return din in self._products and self._is_stale(din)
+
+    def add(self, results):
+        """
+        Index results that carry a DIN; new ones, and fresh copies of stale
+        ones, are appended to the store. Returns how many were written.
+        """
+        new = []
+        now = self._clock()
+        with self._lock:
+            for result in results:
+                din = normalize_din(result.get('din'))
+                if din is None or (din in self._products and not self._is_stale(din)):
+                    continue
+                self._products[din] = result
+                self._fetched[din] = now
+                new.append((din, result))
+            if new and self.path and self.writable:
+                self._append([
+                    [din, result['drug_code'], result['brand_name'], result['company'], f"{now:.0f}"]
+                    for din, result in new
+                ])
+        return len(new)
+
+    def discard(self, din):
+        """Forget a DIN Health Canada no longer lists (a removal row is appended to the store)."""
+        din = normalize_din(din)
+        with self._lock:
+            if self._products.pop(din, None) is None:
+                return
+            self._fetched.pop(din, None)
+            if self.path and self.writable:
+                self._append([[din, '', '', '', f"{self._clock():.0f}"]])
+
+    def wait_for_refreshes(self):
+        """Block until every queued refresh has finished."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _is_stale(self, din):
+        # Called with the lock held; rows written before fetch times were kept count as stale
+        return self._clock() - self._fetched.get(din, 0.0) > self.ttl
+
+    def _schedule(self, din, revalidate):
+        # Called with the lock held
+        if din in self._refreshing:
+            return
+        self._refreshing.add(din)
+        if self._queue is None:
+            import queue
+
+            self._queue = queue.Queue()
+            threading.Thread(target=self._refresh_worker, name='din-refresh', daemon=True).start()
+        self._queue.put((din, revalidate))
+
+    def _refresh_worker(self):
+        while True:
+            din, revalidate = self._queue.get()
+            try:
+                revalidate()
+            except Exception:
+                # Keep serving the stale product
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(din)
+                self._queue.task_done()
+
+    def _append(self, rows):
+        # Called with the lock held
+        import csv
+
+        try:
+            # Other processes may append to the same store
+            with locked(self.path), open(self.path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if f.tell() == 0:
+                    writer.writerow(DIN_FIELDS)
+                writer.writerows(rows)
+        except OSError:
+            # Read-only install: keep serving from memory
+            self.writable = False
+
+
+def read_dins(path):
+    """
+    {din: (SearchResult, fetched_at)} from a DIN store. Later rows win, a
+    row without a brand name removes its DIN, and rows written before fetch
+    times were kept get fetched_at 0 (stale).
+    """
+    import csv
+
+    products = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        # Positional, so rows appended under an older, shorter header still read
+        for row in csv.DictReader(f, fieldnames=DIN_FIELDS):
+            din = normalize_din(row.get('din'))
+            if din is None:
+                continue
+            if not row.get('brand_name'):
+                products.pop(din, None)
+                continue
+            try:
+                fetched_at = float(row.get('fetched_at') or 0)
+            except ValueError:
+                fetched_at = 0.0
+            products[din] = (
+                SearchResult(
+                    brand_name=row['brand_name'],
+                    company=row['company'],
+                    category='Health Canada',
+                    source='Health Canada API',
+                    drug_code=row['drug_code'],
+                    din=din,
+                ),
+                fetched_at,
+            )
+    return products
+
+
+@functools.lru_cache(maxsize=None)
+def load_din_index(path=None):
+    """Load the DIN index once per process (from dins.csv in the state directory by default); every session shares it."""
+    return DinIndex(path if path is not None else state_path(DIN_STORE_NAME))
@@ -0,0 +1,569 @@
+# -*- coding: utf-8 -*-
+"""
+Health Canada Drug Product Database (DPD) API client.
+`requests` is imported on first use so the core package stays network-free at import time.
+
+Responses are cached per process in one partition per language, keyed by
+the search key of the query (medschedule.textkey), so 'Lévothyroxine' and
+'LEVOTHYROXINE' share an entry while English and French answers never
+mix or evict each other. Entries past their TTL are still served and
+refreshed in the background (stale-while-revalidate, see ResponseCache).
+Every request waits for a slot from the process-wide outbound scheduler
+(medschedule.outbound), queued by the thread that started the search.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from medschedule.cachestore import load_cache_backend
+from medschedule.din import load_din_index, normalize_din
+from medschedule.outbound import OUTBOUND, QueueTimeout
+from medschedule.records import ProductDetails, SearchResult
+from medschedule.textkey import search_key
+
+DPD_PRODUCT_URL = "https://health-products.canada.ca/api/drug/drugproduct/"
+DPD_INGREDIENT_URL = "https://health-products.canada.ca/api/drug/activeingredient/"
+DPD_FORM_URL = "https://health-products.canada.ca/api/drug/form/"
+DPD_ROUTE_URL = "https://health-products.canada.ca/api/drug/route/"
+DPD_LANGUAGES = ('en', 'fr')
+DPD_HEADERS = {'User-Agent': 'Medication Schedule Builder/1.0'}
+
+MAX_API_RESULTS = 30
+# One deadline for every lookup of a search (the DPD can take a minute to answer a broad query)
+SEARCH_DEADLINE_SECONDS = 60
+SEARCH_WORKERS = 6
+# Products fetched (one drugproduct?id= call each) for an ingredient match
+INGREDIENT_PRODUCT_LIMIT = 10
+# Merge order of products by the lookup that found them
+LOOKUP_PRIORITY = {'din': 0, 'brand': 1, 'ingredient': 2}
+# Concurrent DIN lookups when resolving a list of DINs
+DIN_WORKERS = 4
+# Product detail lookups (ingredients, form, route) share one deadline
+DETAILS_DEADLINE_SECONDS = 20
+
+# DPD strength units -> the dose units the form offers
+DOSE_UNITS = {'MG': 'mg', 'MCG': 'mcg', 'G': 'g', 'ML': 'mL', 'UNIT': 'units', 'IU': 'units'}
+
+# Per language partition
+CACHE_MAX_ENTRIES = 512
+# Entries are fresh this long, then served stale (and refreshed in the background) until CACHE_MAX_STALE_SECONDS
+CACHE_TTL_SECONDS = 6 * 60 * 60
+CACHE_MAX_STALE_SECONDS = 7 * 24 * 60 * 60
+
+
+class ResponseCache:
+    """
+    LRU cache of DPD answers (search results, product details), one
+    partition per language, shared by every session. Values are stored as
+    given, so they should be immutable (tuples, records).
+
+    Stale-while-revalidate: an entry older than ttl is still returned, and
+    if the caller says how to rebuild it, a refresh is queued for one
+    background worker thread; a key already queued isn't queued again.
+    Only entries older than max_stale count as misses, so popular queries
+    never wait on Health Canada once they're cached. stats() reports
+    fresh/stale hits, misses, refreshes and the mean age of what was served.
+
+    With a shared backend (medschedule.cachestore), every put is written
+    through to it and a local miss is looked up there before it counts as
+    a miss: answers fetched by one process or replica are hits in all of
+    them. Entries are stored as JSON, [wall-clock time, encode(value)], so
+    ages carry over between processes and nothing read back from the
+    backend is ever executed; decode rebuilds the value, and an entry it
+    can't decode is a miss.
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, max_stale=CACHE_MAX_STALE_SECONDS,
+                 languages=DPD_LANGUAGES, clock=time.monotonic, backend=None, namespace='dpd',
+                 encode=None, decode=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_stale = max_stale
+        if backend is not None and (encode is None or decode is None):
+            raise ValueError("a shared backend needs encode and decode")
+        self.backend = backend
+        self.namespace = namespace
+        self._encode = encode
+        self._decode = decode
+        self._clock = clock
+        self._partitions = {lang: OrderedDict() for lang in languages}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._queue = None
+        self._counts = dict.fromkeys(
+            ('fresh_hits', 'stale_hits', 'misses', 'shared_hits', 'refreshes', 'refresh_failures',
+             'refreshes_deduplicated'), 0
+        )
+        self._served_age = 0.0
+
+    def get(self, lang, key, revalidate=None):
+        """
+        Cached value for key in lang's partition, or None if absent or past
+        max_stale. A stale value is returned as is; revalidate (a callable
+        returning the new value, raising to keep the old one) refreshes it
+        in the background.
+        """
+        with self._lock:
+            entry = self._partitions[lang].get(key)
+        if entry is None and self.backend is not None:
+            entry = self._load(lang, key)
+        with self._lock:
+            partition = self._partitions[lang]
+            age = self._clock() - entry[0] if entry is not None else None
+            if entry is None or age > self.max_stale:
+                partition.pop(key, None)
+                self._counts['misses'] += 1
+                return None
+            if key in partition:
+                partition.move_to_end(key)
+            self._served_age += age
+            if age <= self.ttl:
+                self._counts['fresh_hits'] += 1
+            else:
+                self._counts['stale_hits'] += 1
+                if revalidate is not None:
+                    self._schedule(lang, key, revalidate)
+            return entry[1]
+
+    def put(self, lang, key, value):
+        with self._lock:
+            self._store(lang, key, (self._clock(), value))
+        if self.backend is not None:
+            import json
+
+            data = json.dumps([time.time(), self._encode(value)], separators=(',', ':')).encode('utf-8')
+            self.backend.set(self._shared_key(lang, key), data, self.max_stale)
+
+    def size(self, lang):
+        return len(self._partitions[lang])
+
+    def clear(self):
+        with self._lock:
+            for partition in self._partitions.values():
+                partition.clear()
+
+    def stats(self):
+        """Counters plus the number of queued refreshes and the mean age (seconds) of served entries."""
+        with self._lock:
+            stats = dict(self._counts)
+            served = stats['fresh_hits'] + stats['stale_hits']
+            stats['refreshing'] = len(self._refreshing)
+            stats['mean_age_served'] = self._served_age / served if served else 0.0
+        return stats
+
+    def wait_for_refreshes(self):
+        """Block until every queued refresh has finished."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _store(self, lang, key, entry):
+        # Called with the lock held
+        partition = self._partitions[lang]
+        partition[key] = entry
+        partition.move_to_end(key)
+        while len(partition) > self.max_entries:
+            partition.popitem(last=False)
+
+    def _shared_key(self, lang, key):
+        return f"{self.namespace}:{lang}:{key}"
+
+    def _load(self, lang, key):
+        """The backend's entry for key, kept locally with its age; None if it has none."""
+        data = self.backend.get(self._shared_key(lang, key))
+        if data is None:
+            return None
+        import json
+
+        try:
+            stored_at, encoded = json.loads(data)
+            value = self._decode(encoded)
+            stored_at = float(stored_at)
+        except Exception:
+            return None
+        entry = (self._clock() - max(0.0, time.time() - stored_at), value)
+        with self._lock:
+            self._store(lang, key, entry)
+            self._counts['shared_hits'] += 1
+        return entry
+
+    def _schedule(self, lang, key, revalidate):
+        # Called with the lock held
+        if (lang, key) in self._refreshing:
+            self._counts['refreshes_deduplicated'] += 1
+            return
+        self._refreshing.add((lang, key))
+        if self._queue is None:
+            import queue
+
+            self._queue = queue.Queue()
+            threading.Thread(target=self._refresh_worker, name='dpd-cache-refresh', daemon=True).start()
+        self._queue.put((lang, key, revalidate))
+
+    def _refresh_worker(self):
+        while True:
+            lang, key, revalidate = self._queue.get()
+            try:
+                value = revalidate()
+            except Exception:
+                with self._lock:
+                    self._counts['refresh_failures'] += 1
+            else:
+                self.put(lang, key, value)
+                with self._lock:
+                    self._counts['refreshes'] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard((lang, key))
+                self._queue.task_done()
+
+
+def encode_results(results):
+    """Search results as JSON-ready rows (SearchResult.to_tuple())."""
+    return [result.to_tuple() for result in results]
+
+
+def decode_results(rows):
+    return tuple(SearchResult(*(str(field) for field in row)) for row in rows)
+
+
+def encode_details(details):
+    return details.to_tuple()
+
+
+def decode_details(row):
+    drug_code, ingredients, dosage_forms, routes = row
+    return ProductDetails(
+        drug_code=str(drug_code),
+        ingredients=tuple(tuple(str(field) for field in ingredient) for ingredient in ingredients),
+        dosage_forms=tuple(str(form) for form in dosage_forms),
+        routes=tuple(str(route) for route in routes),
+    )
+
+
+RESPONSE_CACHE = ResponseCache(
+    backend=load_cache_backend(), namespace='dpd-search', encode=encode_results, decode=decode_results,
+)
+# Product details change far less often than search results
+DETAILS_CACHE = ResponseCache(
+    ttl=24 * 60 * 60, backend=load_cache_backend(), namespace='dpd-details',
+    encode=encode_details, decode=decode_details,
+)
+
+
+def dpd_search_url(query, lang='en'):
+    """Browser URL of the DPD brand-name search for query (the fallback link when the API can't be reached)."""
+    return f"{DPD_PRODUCT_URL}?brandname={search_key(query)}&lang={lang}&type=json"
+
+
+class DpdError(Exception):
+    """A DPD endpoint answered with something other than 200 OK."""
+
+
+def _get_json(requests, url, params, stop, session=None):
+    """
+    GET url once the outbound scheduler gives session a slot, with the
+    connect timeout capped by the shared deadline; the JSON body as a list.
+    """
+    with OUTBOUND.slot(session, stop):
+        remaining = max(stop - time.monotonic(), 0.1)
+        response = requests.get(url, params=params, timeout=(min(5, remaining), remaining), headers=DPD_HEADERS)
+    if response.status_code != 200:
+        raise DpdError(f"Health Canada API error ({response.status_code}).")
+    data = response.json()
+    # Lookups by id return a single object
+    return data if isinstance(data, list) else [data]
+
+
+def _product_result(item):
+    brand_name = (item.get('brand_name') or '').strip()
+    company = (item.get('company_name') or '').strip()
+    return SearchResult(
+        brand_name=brand_name,
+        company=company if company else 'Health Canada DPD',
+        category='Health Canada',
+        source='Health Canada API',
+        drug_code=str(item.get('drug_code', '')),
+        din=(item.get('drug_identification_number') or '').strip(),
+    )
+
+
+def dpd_lookups(key):
+    """
+    The first-round lookups for a search key, as (kind, url, params):
+    a DIN (all digits, leading zeros optional) by DIN and brand name,
+    anything else by brand name and active ingredient.
+    """
+    if key.isdigit() and len(key) <= 8:
+        return [('din', DPD_PRODUCT_URL, {'din': key.zfill(8)}), ('brand', DPD_PRODUCT_URL, {'brandname': key})]
+    return [('brand', DPD_PRODUCT_URL, {'brandname': key}), ('ingredient_rows', DPD_INGREDIENT_URL, {'ingredientname': key})]
+
+
+def search_health_canada_api(query, lang='en', cache=RESPONSE_CACHE, deadline=SEARCH_DEADLINE_SECONDS,
+                             enough=MAX_API_RESULTS, dins=None):
+    """
+    Search Health Canada's full drug database API, in English ('en') or French ('fr').
+
+    The lookups from dpd_lookups() run concurrently under one deadline;
+    an ingredient hit only gives drug codes, so its products are fetched
+    (by id, also concurrently) as soon as it arrives. Products are merged
+    by drug code, DIN matches first, then brand names, then products of a
+    matching ingredient, and the search returns as soon as enough of them
+    are in, without waiting for slower lookups. Returns (results, error);
+    partial results within the deadline are not an error.
+
+    A DIN already in the DIN index (dins, default the shared one) is
+    answered from it without a call (a stale one is looked up again in the
+    background); products found with a DIN are written through to it.
+    """
+    key = search_key(query)
+    if len(key) < 2:
+        return [], None
+    if lang not in DPD_LANGUAGES:
+        raise ValueError(f"unsupported DPD language: {lang!r}")
+
+    dins = dins if dins is not None else load_din_index()
+    known = dins.get(key, revalidate_din(key, lang, dins)) if key.isdigit() else None
+    if known is not None:
+        return [known], None
+
+    # A stale entry is served now and refreshed in the background by the same fan-out
+    cached = cache.get(lang, key, revalidate_search(key, lang, deadline, enough, dins)) if cache is not None else None
+    if cached is not None:
+        return list(cached), None
+
+    results, timed_out, errors = _fan_out(key, lang, deadline, enough, dins)
+    if not results:
+        if timed_out:
+            return [], "Health Canada API timed out. Please try again or check your network."
+        if errors:
+            return [], str(errors[0]) if isinstance(errors[0], DpdError) else "Health Canada API request failed."
+    # Complete answers only: a partial merge would hide products until the entry expires
+    if cache is not None and not timed_out and not errors:
+        cache.put(lang, key, tuple(results))
+    return results, None
+
+
+def revalidate_search(key, lang='en', deadline=SEARCH_DEADLINE_SECONDS, enough=MAX_API_RESULTS, dins=None):
+    """
+    A ResponseCache revalidate callable for a search key: reruns the
+    fan-out and raises unless the answer is complete, so a failed refresh
+    keeps the stale entry instead of replacing it with less.
+    """
+    def revalidate():
+        results, timed_out, errors = _fan_out(key, lang, deadline, enough, dins if dins is not None else load_din_index())
+        if timed_out:
+            raise DpdError("Health Canada API timed out")
+        if errors:
+            raise errors[0]
+        return tuple(results)
+    return revalidate
+
+
+def _fan_out(key, lang, deadline, enough, dins):
+    """The concurrent lookups of one search: (results, timed_out, errors)."""
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    import requests
+
+    stop = time.monotonic() + deadline
+    # Every lookup of this search queues as the calling thread's session
+    session = threading.get_ident()
+    # drug code -> (priority, result); a product found by several lookups keeps the best
+    found = {}
+    requested_codes = set()
+    errors = []
+    timed_out = False
+
+    pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix='dpd-search')
+    try:
+        pending = {
+            pool.submit(_get_json, requests, url, dict(params, lang=lang, type='json'), stop, session): kind
+            for kind, url, params in dpd_lookups(key)
+        }
+        # An exact DIN match is the answer; otherwise stop once enough products are in
+        while pending and len(found) < enough and not any(priority == 0 for priority, _ in found.values()):
+            remaining = stop - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind = pending.pop(future)
+                try:
+                    items = future.result()
+                except (requests.exceptions.Timeout, QueueTimeout):
+                    timed_out = True
+                    continue
+                except Exception as e:
+                    errors.append(e)
+                    continue
+
+                if kind == 'ingredient_rows':
+                    # Active-ingredient rows carry drug codes only: fetch their products
+                    for item in items:
+                        code = item.get('drug_code')
+                        if code is None or code in found or code in requested_codes:
+                            continue
+                        if len(requested_codes) >= INGREDIENT_PRODUCT_LIMIT:
+                            break
+                        requested_codes.add(code)
+                        params = {'id': code, 'lang': lang, 'type': 'json'}
+                        pending[pool.submit(_get_json, requests, DPD_PRODUCT_URL, params, stop, session)] = 'ingredient'
+                    continue
+
+                priority = LOOKUP_PRIORITY[kind]
+                for item in items[:100]:
+                    code = item.get('drug_code')
+                    if code is None or not (item.get('brand_name') or '').strip():
+                        continue
+                    if code not in found or priority < found[code][0]:
+                        # Re-inserted so arrival order holds within each kind
+                        found.pop(code, None)
+                        found[code] = (priority, _product_result(item))
+    finally:
+        # Don't wait for lookups still in flight; their answers are no longer needed
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Stable sort: arrival order within each kind
+    results = [result for _, result in sorted(found.values(), key=lambda entry: entry[0])][:MAX_API_RESULTS]
+    dins.add(results)
+    return results, timed_out, errors
+
+
+def lookup_din(din, lang='en', dins=None, timeout=SEARCH_DEADLINE_SECONDS, session=None, refresh=False):
+    """
+    The product with this DIN: from the DIN index (a stale one is looked up
+    again in the background), else from drugproduct?din= (written through
+    to the index). refresh skips the index and replaces or discards its
+    entry. None if Health Canada has no such DIN; request failures raise.
+    """
+    din = normalize_din(din)
+    if din is None:
+        return None
+    dins = dins if dins is not None else load_din_index()
+    if not refresh:
+        known = dins.get(din, revalidate_din(din, lang, dins))
+        if known is not None:
+            return known
+
+    import requests
+
+    stop = time.monotonic() + timeout
+    session = session if session is not None else threading.get_ident()
+    items = _get_json(requests, DPD_PRODUCT_URL, {'din': din, 'lang': lang, 'type': 'json'}, stop, session)
+    results = [_product_result(item) for item in items if (item.get('brand_name') or '').strip()]
+    dins.add(results)
+    if refresh and dins.stale(din):
+        # Health Canada no longer lists it
+        dins.discard(din)
+    return dins.get(din)
+
+
+def revalidate_din(din, lang='en', dins=None):
+    """A DinIndex revalidate callable: looks the DIN up again, replacing or discarding the stale product."""
+    def revalidate():
+        lookup_din(din, lang, dins, refresh=True)
+    return revalidate
+
+
+def resolve_dins(din_list, lang='en', dins=None, workers=DIN_WORKERS):
+    """
+    {din: product or None} for a list of DINs, e.g. a whole medication
+    history. Known DINs come from the index; the rest are looked up at most
+    `workers` at a time, so a long list doesn't open a connection per DIN.
+    A failed lookup resolves to None.
+    """
+    dins = dins if dins is not None else load_din_index()
+    wanted = [din for din in (normalize_din(din) for din in din_list) if din is not None]
+    resolved = {din: dins.get(din, revalidate_din(din, lang, dins)) for din in wanted}
+    missing = [din for din, product in resolved.items() if product is None]
+    if not missing:
+        return resolved
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The whole list queues as one session, taking turns with other sessions' searches
+    session = threading.get_ident()
+
+    def lookup(din):
+        try:
+            return lookup_din(din, lang, dins, session=session)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(missing)), thread_name_prefix='dpd-din') as pool:
+        for din, product in zip(missing, pool.map(lookup, missing)):
+            resolved[din] = product
+    return resolved
+
+
+def fetch_product_details(drug_code, lang='en', cache=DETAILS_CACHE, deadline=DETAILS_DEADLINE_SECONDS):
+    """
+    ProductDetails for a drug code, or None if it can't be fetched.
+
+    Called when a Health Canada product is selected, not per search hit:
+    the active-ingredient, form and route lookups run concurrently, and
+    the answer is cached per drug code (and language).
+    """
+    drug_code = str(drug_code or '').strip()
+    if not drug_code:
+        return None
+    cached = cache.get(lang, drug_code, lambda: _fetch_details(drug_code, lang, deadline)) if cache is not None else None
+    if cached is not None:
+        return cached
+    try:
+        details = _fetch_details(drug_code, lang, deadline)
+    except Exception:
+        return None
+    if cache is not None:
+        cache.put(lang, drug_code, details)
+    return details
+
+
+def _fetch_details(drug_code, lang, deadline):
+    """ProductDetails from the three lookups; request failures raise."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    stop = time.monotonic() + deadline
+    session = threading.get_ident()
+    params = {'id': drug_code, 'lang': lang, 'type': 'json'}
+    urls = (DPD_INGREDIENT_URL, DPD_FORM_URL, DPD_ROUTE_URL)
+    with ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix='dpd-details') as pool:
+        futures = [pool.submit(_get_json, requests, url, params, stop, session) for url in urls]
+        ingredients, forms, routes = [future.result() for future in futures]
+
+    return ProductDetails(
+        drug_code=drug_code,
+        ingredients=tuple(
+            (
+                (item.get('ingredient_name') or '').strip(),
+                (item.get('strength') or '').strip(),
+                (item.get('strength_unit') or '').strip(),
+            )
+            for item in ingredients if item.get('ingredient_name')
+        ),
+        dosage_forms=tuple((item.get('pharmaceutical_form_name') or '').strip() for item in forms if item.get('pharmaceutical_form_name')),
+        routes=tuple((item.get('route_of_administration_name') or '').strip() for item in routes if item.get('route_of_administration_name')),
+    )
+
+
+def prefill_dose(details):
+    """
+    (dose value, dose unit) for the form from a single-ingredient product's
+    strength, e.g. ATORVASTATIN 20 MG -> (20.0, 'mg'); None for combination
+    products or units the form doesn't offer.
+    """
+    if details is None or len(details.ingredients) != 1:
+        return None
+    _, strength, unit = details.ingredients[0]
+    unit = DOSE_UNITS.get(unit.upper())
+    try:
+        value = float(strength)
+    except ValueError:
+        return None
+    if unit is None or value <= 0:
+        return None
+    return value, unit
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Brand ↔ generic equivalence index.
+
+The catalogue stores brand and generic names as unrelated rows (SYNTHROID,
+LEVOTHYROXINE, ELTROXIN). data/equivalents.csv lists ingredient,name edges;
+a union-find over those edges collapses them into ingredient groups (an
+edge may join two groups, e.g. SALBUTAMOL/ALBUTEROL), and the groups are
+resolved to catalogue rows once per process. A combination product lists
+its ingredients joined by '+' (OXYCODONE+ACETAMINOPHEN,PERCOCET): it is a
+group of its own for search, but screens as each of its ingredients.
+Afterwards:
+
+    group of a catalogue row          list lookup
+    other rows in that group          precomputed tuple
+    ingredients of a free-text name   dict lookups over runs of words
+
+so search can expand every hit to its equivalents in O(1), and duplicate
+therapy on a medication list is found in one linear pass.
+"""
+
+import functools
+import os
+import re
+
+from medschedule.catalogue import DATA_DIR
+from medschedule.database import MEDICATION_DATABASE
+from medschedule.textkey import search_key
+
+EQUIVALENTS_PATH = os.path.join(DATA_DIR, 'equivalents.csv')
+
+# Generic-manufacturer prefixes on DPD brand names (APO-ATORVASTATIN, SANDOZ ATORVASTATIN)
+_GENERIC_PREFIX = re.compile(
+    r'^(?:ACH|ACT|AG|APO|AURO|BIO|DOM|GD|JAMP|M|MAR|MINT|MYLAN|NAT|NRA|NOVO|PMS|PRO|RAN|RATIO|RIVA|'
+    r'SANDOZ|SANIS|TARO|TEVA|ZYM)[- ]+'
+)
+
+
+def normalize_name(name):
+    """The index key of a name: its search key (medschedule.textkey), so 'Lévothyroxine' is LEVOTHYROXINE."""
+    return search_key(str(name))
+
+
+class _DisjointSet:
+    """Union-find with path halving and union by size."""
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def find(self, item):
+        parent = self.parent
+        if item not in parent:
+            parent[item] = item
+            self.size[item] = 1
+            return item
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
+
+
+class EquivalenceIndex:
+    """Ingredient groups over the catalogue, built once from ingredient,name edges."""
+
+    def __init__(self, edges, catalogue=MEDICATION_DATABASE):
+        sets = _DisjointSet()
+        labels = []
+        components = {}
+        for ingredient, name in edges:
+            # A combination product lists its ingredients joined by '+' (OXYCODONE+ACETAMINOPHEN)
+            parts = tuple(normalize_name(part) for part in ingredient.split('+'))
+            ingredient, name = ' + '.join(parts), normalize_name(name)
+            if len(parts) > 1:
+                components[ingredient] = parts
+            sets.union(ingredient, name)
+            labels.append(ingredient)
+        # Each component is a name too, so "TYLENOL WITH CODEINE" finds CODEINE
+        for parts in components.values():
+            for part in parts:
+                sets.find(part)
+                labels.append(part)
+
+        # The first ingredient listed for a group names it
+        group_ids = {}
+        self.ingredients = []
+        for ingredient in labels:
+            root = sets.find(ingredient)
+            if root not in group_ids:
+                group_ids[root] = len(self.ingredients)
+                self.ingredients.append(ingredient)
+
+        self._name_group = {name: group_ids[sets.find(name)] for name in sets.parent}
+
+        # Ingredients of each group: its own name, or a combination's components as named by their groups
+        self._group_ingredients = [
+            tuple(
+                self.ingredients[self._name_group[part]] if part in self._name_group else part
+                for part in components[ingredient]
+            ) if ingredient in components else (ingredient,)
+            for ingredient in self.ingredients
+        ]
+
+        # Resolve groups to catalogue rows; repeated names keep their first row
+        members = [[] for _ in self.ingredients]
+        self._row_group = [-1] * len(catalogue)
+        seen = set()
+        for row in range(len(catalogue)):
+            name = catalogue.key(row)
+            group = self._name_group.get(name, -1)
+            self._row_group[row] = group
+            if group >= 0 and name not in seen:
+                seen.add(name)
+                members[group].append(row)
+        self._group_rows = [tuple(rows) for rows in members]
+
+    def group_of_row(self, row):
+        """Group id of a catalogue row, or -1."""
+        return self._row_group[row]
+
+    def equivalent_rows(self, row):
+        """Catalogue rows sharing row's ingredient (including row's own name), or ()."""
+        group = self._row_group[row]
+        return self._group_rows[group] if group >= 0 else ()
+
+    def ingredient(self, name):
+        """Ingredient group name for a brand/generic/DPD name, or None if unknown or it names several groups."""
+        groups = self._groups(name)
+        return self.ingredients[groups[0]] if len(groups) == 1 else None
+
+    def ingredients_of(self, name):
+        """Every ingredient of a brand/generic/DPD name (a combination has several), or () if unknown."""
+        found = []
+        for group in self._groups(name):
+            for ingredient in self._group_ingredients[group]:
+                if ingredient not in found:
+                    found.append(ingredient)
+        return tuple(found)
+
+    def therapy_keys(self, name):
+        """Ingredients if known, else the normalized name itself (so exact repeats still match)."""
+        return self.ingredients_of(name) or (normalize_name(name),)
+
+    def _groups(self, name):
+        key = normalize_name(name)
+        groups = self._scan(key)
+        if not groups:
+            stripped = _GENERIC_PREFIX.sub('', key)
+            if stripped != key:
+                groups = self._scan(stripped)
+        return groups
+
+    def _scan(self, key):
+        # Every longest run of words in the index, left to right: "SYNTHROID 0.1MG" -> SYNTHROID,
+        # "BUDESONIDE NASAL SPRAY" -> BUDESONIDE NASAL, "TYLENOL WITH CODEINE" -> TYLENOL, CODEINE
+        group = self._name_group.get(key, -1)
+        if group >= 0:
+            return [group]
+        words = key.split(' ')
+        groups = []
+        start = 0
+        while start < len(words):
+            for end in range(len(words), start, -1):
+                group = self._name_group.get(' '.join(words[start:end]), -1)
+                if group >= 0:
+                    if group not in groups:
+                        groups.append(group)
+                    start = end
+                    break
+            else:
+                start += 1
+        return groups
+
+
+def read_edges(path=EQUIVALENTS_PATH):
+    import csv
+
+    with open(path, newline='', encoding='utf-8') as f:
+        return [(row['ingredient'], row['name']) for row in csv.DictReader(f)]
+
+
+@functools.lru_cache(maxsize=None)
+def load_equivalence_index(path=EQUIVALENTS_PATH):
+    """Build the index once per process; every session shares it."""
+    return EquivalenceIndex(read_edges(path))
+
+
+def expand_rows(rows, limit=None, index=None):
+    """
+    Direct hits followed by their equivalents, as (row, via) pairs.
+
+    via is None for a direct hit and the hit's row for an equivalent.
+    Names already listed are skipped, so each name appears once.
+    """
+    index = index or load_equivalence_index()
+    seen = set()
+    direct = []
+    for row in rows:
+        name = MEDICATION_DATABASE.brand_name(row)
+        if name not in seen:
+            seen.add(name)
+            direct.append((row, None))
+    expanded = list(direct)
+    for row, _ in direct:
+        for other in index.equivalent_rows(row):
+            if limit is not None and len(expanded) >= limit:
+                return expanded[:limit]
+            name = MEDICATION_DATABASE.brand_name(other)
+            if name not in seen:
+                seen.add(name)
+                expanded.append((other, row))
+    return expanded[:limit] if limit is not None else expanded
+
+
+def find_duplicate_therapy(meds, index=None):
+    """
+    Medications sharing an ingredient with another entry, in one pass.
+
+    Returns {med id: (ingredients, names of the other entries)} for every
+    entry with an ingredient (or exact name, if unknown) that occurs more
+    than once; a combination product can share several (ingredients is
+    then a comma-separated list).
+    """
+    index = index or load_equivalence_index()
+    keys = {}
+    by_key = {}
+    for med in meds:
+        keys[med['id']] = index.therapy_keys(med['name'])
+        for key in keys[med['id']]:
+            by_key.setdefault(key, []).append(med)
+
+    flags = {}
+    for med in meds:
+        shared = [key for key in keys[med['id']] if len(by_key[key]) > 1]
+        if shared:
+            others = []
+            for key in shared:
+                for other in by_key[key]:
+                    if other is not med and other['name'] not in others:
+                        others.append(other['name'])
+            flags[med['id']] = (', '.join(shared), tuple(others))
+    return flags
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Daily-total and maximum-dose guardrails over the whole schedule horizon.
+
+Every medication is expanded once into a meds x days x slots dose tensor
+(dose per administration, zero where the slot isn't taken), following the
+same day rules as get_dose_for_day(): constant dose, gradual steps or
+custom day ranges. Summing over slots gives each entry's daily dose;
+adding entries that share an ingredient (brand and generic resolve alike
+through medschedule.equivalents) gives per-ingredient daily totals for
+every day of the horizon in a few array operations, which are compared
+with data/max_doses.csv. A combination product has one strength, which
+counts towards the ingredient listed first in data/equivalents.csv (the
+one its strength is written for, e.g. the oxycodone of PERCOCET 5). A taper step or overlapping entries that exceed
+the ceiling show up as violating days, whether the horizon is two months
+or a year.
+"""
+
+import functools
+import os
+
+import numpy as np
+
+from medschedule.catalogue import DATA_DIR
+from medschedule.equivalents import load_equivalence_index, normalize_name
+from medschedule.records import DoseViolation
+
+MAX_DOSES_PATH = os.path.join(DATA_DIR, 'max_doses.csv')
+
+TIME_SLOTS = ('Morning', 'Noon', 'Evening', 'Bedtime')
+
+# Two calendar months, the span the PDF calendar prints
+DEFAULT_HORIZON_DAYS = 62
+
+# Mass units convert to each other; other units (mL, tablet, puffs...) only compare like for like
+MASS_UNITS_IN_MG = {'mcg': 0.001, 'mg': 1.0, 'g': 1000.0}
+
+
+def unit_factor(unit, limit_unit):
+    """Multiplier from unit to limit_unit, or None if they can't be compared."""
+    if unit == limit_unit:
+        return 1.0
+    if unit in MASS_UNITS_IN_MG and limit_unit in MASS_UNITS_IN_MG:
+        return MASS_UNITS_IN_MG[unit] / MASS_UNITS_IN_MG[limit_unit]
+    return None
+
+
+def read_max_doses(path=MAX_DOSES_PATH):
+    import csv
+
+    with open(path, newline='', encoding='utf-8') as f:
+        return {
+            normalize_name(row['ingredient']): (float(row['max_daily']), row['unit'].strip())
+            for row in csv.DictReader(f)
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def load_max_dose_table(path=MAX_DOSES_PATH):
+    """{ingredient: (max daily dose, unit)}, loaded once per process."""
+    return read_max_doses(path)
+
+
+def schedule_horizon(meds, minimum=DEFAULT_HORIZON_DAYS):
+    """Days to check: at least minimum, extended to the last dose change of any schedule."""
+    horizon = minimum
+    for med in meds:
+        schedule = med.get('dose_schedule') if med.get('variable_dosing') else None
+        if not schedule:
+            continue
+        if schedule['type'] == 'gradual':
+            for step in schedule.get('steps', []):
+                horizon = max(horizon, int(step['day']) + 1)
+        elif schedule['type'] == 'custom':
+            for r in schedule.get('ranges', []):
+                horizon = max(horizon, int(r['end_day']))
+    return horizon
+
+
+def daily_doses(med, days):
+    """Dose per administration for day offsets 0..days-1 (same rules as get_dose_for_day)."""
+    base = float(med['strength_value'])
+    schedule = med.get('dose_schedule') if med.get('variable_dosing') else None
+    if not schedule:
+        return np.full(days, base)
+
+    if schedule['type'] == 'gradual':
+        steps = schedule.get('steps', [])
+        if not steps:
+            return np.full(days, base)
+        step_days = np.array([step['day'] for step in steps])
+        step_doses = np.array([float(step['dose']) for step in steps])
+        # Each day takes the last step that has started; days before the first step take the first
+        current = np.searchsorted(step_days, np.arange(days), side='right') - 1
+        return step_doses[np.maximum(current, 0)]
+
+    if schedule['type'] == 'custom':
+        doses = np.full(days, base)
+        # Ranges are 1-based and inclusive; the first matching range wins, so paint them last-to-first
+        for r in reversed(schedule.get('ranges', [])):
+            doses[max(int(r['start_day']) - 1, 0):max(int(r['end_day']), 0)] = float(r['dose'])
+        return doses
+
+    return np.full(days, base)
+
+
+def dose_tensor(meds, days):
+    """meds x days x slots array of the dose given at each time slot."""
+    if not meds:
+        return np.zeros((0, days, len(TIME_SLOTS)))
+    doses = np.stack([daily_doses(med, days) for med in meds])
+    slots = np.array([[slot in med.get('time_slots', ()) for slot in TIME_SLOTS] for med in meds], dtype=float)
+    return doses[:, :, None] * slots[:, None, :]
+
+
+def check_daily_limits(meds, days=None, table=None, index=None):
+    """
+    DoseViolations for every ingredient whose summed daily dose exceeds its
+    maximum on some day of the horizon (today = day 0).
+
+    Entries without a known maximum, or in a unit that can't be compared
+    with it, are left out of the totals.
+    """
+    table = table if table is not None else load_max_dose_table()
+    index = index or load_equivalence_index()
+
+    checked, ingredients, groups, factors = [], [], [], []
+    group_of = {}
+    for med in meds:
+        ingredient = index.therapy_keys(med['name'])[0]
+        limit = table.get(ingredient)
+        if limit is None:
+            continue
+        factor = unit_factor(med['strength_unit'], limit[1])
+        if factor is None:
+            continue
+        if ingredient not in group_of:
+            group_of[ingredient] = len(ingredients)
+            ingredients.append(ingredient)
+        checked.append(med)
+        groups.append(group_of[ingredient])
+        factors.append(factor)
+    if not checked:
+        return []
+
+    days = days or schedule_horizon(checked)
+    daily = dose_tensor(checked, days).sum(axis=2) * np.array(factors)[:, None]
+
+    groups = np.array(groups)
+    totals = np.zeros((len(ingredients), days))
+    np.add.at(totals, groups, daily)
+    limits = np.array([table[ingredient][0] for ingredient in ingredients])
+    # Small tolerance so a total that equals the maximum after unit conversion isn't flagged
+    over = totals > limits[:, None] * (1 + 1e-9)
+
+    violations = []
+    for g in np.flatnonzero(over.any(axis=1)):
+        days_over = np.flatnonzero(over[g])
+        violations.append(DoseViolation(
+            ingredient=ingredients[g],
+            unit=table[ingredients[g]][1],
+            max_daily=float(limits[g]),
+            peak_total=float(totals[g, days_over].max()),
+            days=tuple(int(day) for day in days_over),
+            med_ids=tuple(checked[i]['id'] for i in np.flatnonzero(groups == g)),
+        ))
+    return violations
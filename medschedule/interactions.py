@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Drug-drug interaction screening over a medication list.
+
+data/interactions.csv lists interacting ingredient pairs (ingredient names
+as resolved by medschedule.equivalents, so SYNTHROID and ELTROXIN both
+screen as LEVOTHYROXINE, and PERCOCET as OXYCODONE and ACETAMINOPHEN).
+It is loaded once per process into a hashed pair table plus a partner set
+per ingredient.
+
+InteractionScreen keeps one list's alerts up to date incrementally: adding
+a medication checks only the new ingredients' partners against the
+ingredients already on the list, instead of rescanning every pair.
+"""
+
+import functools
+import os
+import sys
+
+from medschedule.catalogue import DATA_DIR
+from medschedule.equivalents import load_equivalence_index, normalize_name
+from medschedule.records import InteractionAlert
+
+INTERACTIONS_PATH = os.path.join(DATA_DIR, 'interactions.csv')
+
+SEVERITY_RANK = {'major': 0, 'moderate': 1, 'minor': 2}
+
+
+def _pair(a, b):
+    return (a, b) if a <= b else (b, a)
+
+
+class InteractionTable:
+    """Interacting ingredient pairs, keyed by the sorted pair of normalized ingredients."""
+
+    def __init__(self, rows):
+        self._pairs = {}
+        self._partners = {}
+        for a, b, severity, description in rows:
+            a, b = normalize_name(a), normalize_name(b)
+            self._pairs[_pair(a, b)] = (sys.intern(severity.strip().lower()), sys.intern(description.strip()))
+            self._partners.setdefault(a, set()).add(b)
+            self._partners.setdefault(b, set()).add(a)
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def lookup(self, a, b):
+        """(severity, description) for an ingredient pair, or None."""
+        return self._pairs.get(_pair(a, b))
+
+    def partners(self, ingredient):
+        """Ingredients that interact with ingredient."""
+        return self._partners.get(ingredient, ())
+
+
+def read_interactions(path=INTERACTIONS_PATH):
+    import csv
+
+    with open(path, newline='', encoding='utf-8') as f:
+        return [
+            (row['ingredient_a'], row['ingredient_b'], row['severity'], row['description'])
+            for row in csv.DictReader(f)
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def load_interaction_table(path=INTERACTIONS_PATH):
+    """Build the pair table once per process; every session shares it."""
+    return InteractionTable(read_interactions(path))
+
+
+class InteractionScreen:
+    """
+    Interaction alerts for one medication list, maintained as entries come and go.
+
+    Holds only plain per-list state (ingredients of each entry, entries per
+    ingredient, current alerts); the shared tables are looked up per call,
+    so an instance can live in session state.
+    """
+
+    def __init__(self):
+        self._keys = {}        # med id -> ingredients
+        self._by_key = {}      # ingredient -> {med id: name}
+        self.alerts = []
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, med, table=None, index=None):
+        """Screen med against the entries already on the list; returns the new alerts."""
+        table = table or load_interaction_table()
+        index = index or load_equivalence_index()
+        keys = index.therapy_keys(med['name'])
+
+        new_alerts = []
+        seen = set()
+        for key in keys:
+            # Walk whichever side is smaller: the ingredient's partners or the ingredients on the list
+            partners = table.partners(key)
+            if len(partners) <= len(self._by_key):
+                present = [other for other in partners if other in self._by_key]
+            else:
+                present = [other for other in self._by_key if other in partners]
+
+            for other in present:
+                severity, description = table.lookup(key, other)
+                for other_id, other_name in self._by_key[other].items():
+                    # Two combinations can meet through several ingredient pairs with the same warning
+                    if (other_id, description) not in seen:
+                        seen.add((other_id, description))
+                        new_alerts.append(InteractionAlert(severity, other_id, med['id'], other_name, med['name'], description))
+
+        self._keys[med['id']] = keys
+        for key in keys:
+            self._by_key.setdefault(key, {})[med['id']] = med['name']
+        self.alerts.extend(new_alerts)
+        return new_alerts
+
+    def remove(self, med_id):
+        """Drop an entry and the alerts it was part of."""
+        keys = self._keys.pop(med_id, None)
+        if keys is None:
+            return
+        for key in keys:
+            members = self._by_key[key]
+            members.pop(med_id, None)
+            if not members:
+                del self._by_key[key]
+        self.alerts = [a for a in self.alerts if a.first_id != med_id and a.second_id != med_id]
+
+    def sorted_alerts(self):
+        """Alerts, most severe first (stable, so list order is kept within a severity)."""
+        return sorted(self.alerts, key=lambda a: SEVERITY_RANK.get(a.severity, len(SEVERITY_RANK)))
+
+
+def screen_medications(meds, table=None, index=None):
+    """All interaction alerts for a medication list, most severe first."""
+    screen = InteractionScreen()
+    for med in meds:
+        screen.add(med, table, index)
+    return screen.sorted_alerts()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide scheduler for requests to Health Canada.
+
+Every DPD request waits here for a slot. A token bucket bounds the rate
+(RATE_PER_SECOND, bursts up to BURST), a counter bounds how many are in
+flight at once (MAX_CONCURRENT), and waiting requests are queued per
+session and granted round-robin, so one session resolving a long DIN list
+doesn't hold back everyone else's searches. A burst of users then waits
+in line for a bounded number of connections instead of opening one per
+lookup.
+
+A session is any hashable key; medschedule.dpd uses the thread that
+started a search, which is the Streamlit script thread of a session (or
+the cache refresh and warmup threads, which queue like any other).
+
+stats() reports the queue depth (now and peak), requests in flight, and
+the mean, p95 and max wait of recent requests.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+
+RATE_PER_SECOND = 20
+BURST = 20
+MAX_CONCURRENT = 8
+# Waits kept for the percentile
+RECENT_WAITS = 1000
+
+
+class QueueTimeout(TimeoutError):
+    """A request's deadline passed before it got a slot."""
+
+
+class OutboundScheduler:
+    """Token bucket + bounded concurrency + per-session round-robin queue."""
+
+    def __init__(self, rate=RATE_PER_SECOND, burst=BURST, max_concurrent=MAX_CONCURRENT, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self._clock = clock
+        self._tokens = float(burst)
+        self._refilled = clock()
+        self._active = 0
+        # session -> deque of waiters, in round-robin order
+        self._queues = OrderedDict()
+        self._queued = 0
+        self._cond = threading.Condition()
+        self._counts = dict.fromkeys(('requests', 'timeouts', 'peak_queued', 'peak_active'), 0)
+        self._waits = deque(maxlen=RECENT_WAITS)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def slot(self, session=None, stop=None):
+        """Context manager holding one slot; waits until stop (a monotonic time) at most, then raises QueueTimeout."""
+        return _Slot(self, session, stop)
+
+    def acquire(self, session=None, stop=None):
+        waiter = _Waiter()
+        queued_at = self._clock()
+        with self._cond:
+            self._queues.setdefault(session, deque()).append(waiter)
+            self._queued += 1
+            self._counts['peak_queued'] = max(self._counts['peak_queued'], self._queued)
+            while True:
+                retry_in = self._dispatch()
+                if waiter.granted:
+                    break
+                timeout = retry_in
+                if stop is not None:
+                    remaining = stop - self._clock()
+                    if remaining <= 0:
+                        self._withdraw(session, waiter)
+                        self._counts['timeouts'] += 1
+                        raise QueueTimeout("Health Canada is busy. Please try again.")
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                self._cond.wait(timeout)
+            waited = self._clock() - queued_at
+            self._counts['requests'] += 1
+            self._waits.append(waited)
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._dispatch()
+            # Waiters re-check (and sleep until the next token) even if nothing could be granted yet
+            self._cond.notify_all()
+
+    def stats(self):
+        """Queue depth, requests in flight, and wait times (seconds)."""
+        with self._cond:
+            stats = dict(self._counts)
+            stats['queued'] = self._queued
+            stats['active'] = self._active
+            waits = sorted(self._waits)
+            stats['mean_wait'] = self._wait_total / stats['requests'] if stats['requests'] else 0.0
+            stats['p95_wait'] = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+            stats['max_wait'] = self._wait_max
+        return stats
+
+    def _dispatch(self):
+        """
+        Grant slots round-robin while both a token and a concurrency slot
+        are free. Called with the lock held; returns seconds until the next
+        token if waiters are left and the bucket is short of one, else None
+        (they wait for a release).
+        """
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        granted = False
+        while self._queues and self._active < self.max_concurrent and self._tokens >= 1:
+            session, waiters = next(iter(self._queues.items()))
+            waiters.popleft().granted = True
+            self._queued -= 1
+            self._active += 1
+            self._tokens -= 1
+            # This session goes to the back of the line
+            del self._queues[session]
+            if waiters:
+                self._queues[session] = waiters
+            granted = True
+        self._counts['peak_active'] = max(self._counts['peak_active'], self._active)
+        if granted:
+            self._cond.notify_all()
+        if self._queues and self._tokens < 1:
+            # Also when every slot is busy: a slot freed before the token refills grants nothing
+            return (1 - self._tokens) / self.rate
+        return None
+
+    def _withdraw(self, session, waiter):
+        """Take a timed-out waiter out of its queue; a slot granted to it meanwhile goes back."""
+        if waiter.granted:
+            # Dequeued and counted as active by the grant: nobody else will release it
+            self._active -= 1
+            self._dispatch()
+            self._cond.notify_all()
+            return
+        waiters = self._queues[session]
+        # By identity: other threads of the same session wait in this deque too
+        for i, queued in enumerate(waiters):
+            if queued is waiter:
+                del waiters[i]
+                break
+        if not waiters:
+            del self._queues[session]
+        self._queued -= 1
+
+
+class _Waiter:
+    __slots__ = ('granted',)
+
+    def __init__(self):
+        self.granted = False
+
+
+class _Slot:
+    __slots__ = ('scheduler', 'session', 'stop')
+
+    def __init__(self, scheduler, session, stop):
+        self.scheduler = scheduler
+        self.session = session
+        self.stop = stop
+
+    def __enter__(self):
+        self.scheduler.acquire(self.session, self.stop)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.scheduler.release()
+        return False
+
+
+OUTBOUND = OutboundScheduler()
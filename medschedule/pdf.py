@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+Landscape calendar PDF export for a medication list.
+
+cached_pdf() keys each rendered PDF by the list's content and the day, in
+the shared cache backend if one is configured (medschedule.cachestore),
+else in this process: reopening the preview, ticking its checkbox or
+exporting the same list from another replica doesn't render it again.
+"""
+
+import hashlib
+from datetime import datetime
+
+from fpdf import FPDF
+
+from medschedule.cachestore import MemoryBackend, load_cache_backend
+from medschedule.interactions import screen_medications
+from medschedule.schedule import get_dose_for_day
+
+
+# Day-cell layout tiers, tried in order until every medication fits:
+# (columns, row pitch mm, pill height mm, font size pt)
+DAY_CELL_TIERS = [
+    (1, 6.0, 5.0, 5),
+    (1, 4.0, 3.5, 4.5),
+    (2, 4.0, 3.5, 4.5),
+    (2, 3.0, 2.7, 4),
+]
+
+PDF_CACHE_TTL_SECONDS = 24 * 60 * 60
+# When no shared backend is configured
+PDF_MEMORY_CACHE = MemoryBackend(max_entries=64)
+# Per-entry fields that don't change the rendered PDF
+PDF_KEY_IGNORED = ('id', 'added_at')
+
+
+def fit_label(pdf, name, dose_text, max_width):
+    """Truncate the medication name so name + dose fits the pill width; the dose is never cut."""
+    label = f"{name} {dose_text}"
+    if pdf.get_string_width(label) <= max_width:
+        return label
+    for cut in range(len(name) - 1, 2, -1):
+        label = f"{name[:cut]}. {dose_text}"
+        if pdf.get_string_width(label) <= max_width:
+            return label
+    return f"{name[:3]}. {dose_text}"
+
+
+def plan_day_cell_layout(pdf, entries, col_width, row_height):
+    """
+    Compute pill positions, colours and fitted labels for one calendar day cell.
+    entries is a tuple of (name, dose, unit, is_manual); the returned draw list is
+    relative to the cell origin so it can be replayed for every matching day.
+    """
+    top = 7
+    usable_height = row_height - top - 1
+    count = len(entries)
+
+    for columns, pitch, pill_height, font_size in DAY_CELL_TIERS:
+        rows = int(usable_height // pitch)
+        if rows * columns >= count:
+            break
+    capacity = rows * columns
+    # Reserve the last slot for a "+N more" marker when even the densest tier overflows
+    shown = entries if count <= capacity else entries[:capacity - 1]
+
+    pill_width = (col_width - 2 - (columns - 1)) / columns
+    pdf.set_font('Helvetica', '', font_size)
+
+    pills = []
+    for slot, (name, dose, unit, is_manual) in enumerate(shown):
+        row, column = divmod(slot, columns)
+        x = 1 + column * (pill_width + 1)
+        y = top + row * pitch
+        label = fit_label(pdf, name, f"{dose}{unit}", pill_width - 2)
+        pills.append((x, y, is_manual, label))
+
+    overflow = None
+    if len(shown) < count:
+        row, column = divmod(capacity - 1, columns)
+        overflow = (1 + column * (pill_width + 1), top + row * pitch, f'+{count - len(shown)} more')
+
+    return {
+        'font_size': font_size,
+        'pill_width': pill_width,
+        'pill_height': pill_height,
+        'pills': pills,
+        'overflow': overflow,
+    }
+
+
+def draw_day_cell_layout(pdf, layout, x_cell, y_cell):
+    """Replay a precomputed day-cell layout at the given cell origin."""
+    pill_width = layout['pill_width']
+    pill_height = layout['pill_height']
+    pdf.set_font('Helvetica', '', layout['font_size'])
+    pdf.set_text_color(30, 30, 30)
+
+    for x, y, is_manual, label in layout['pills']:
+        # Med pill/badge
+        if is_manual:
+            pdf.set_fill_color(255, 224, 178)  # Orange
+        else:
+            pdf.set_fill_color(200, 230, 201)  # Green
+        pdf.rect(x_cell + x, y_cell + y, pill_width, pill_height, 'F')
+        pdf.set_xy(x_cell + x + 1, y_cell + y)
+        pdf.cell(pill_width - 2, pill_height, label, align='L')
+
+    if layout['overflow']:
+        # Show overflow indicator with the number of hidden medications
+        x, y, label = layout['overflow']
+        pdf.set_text_color(150, 150, 150)
+        pdf.set_xy(x_cell + x, y_cell + y)
+        pdf.cell(pill_width, pill_height, label, align='R')
+
+
+def generate_pdf(med_list):
+    """Generate a landscape PDF with monthly calendar view."""
+    import calendar
+
+    pdf = FPDF(orientation='L', unit='mm', format='A4')
+    pdf.set_auto_page_break(auto=False)
+
+    today = datetime.now()
+    current_month = today.month
+    current_year = today.year
+
+    # Fixed-dose entries never change between days; only variable ones are re-evaluated per cell
+    fixed_entries = [
+        None if (med.get('variable_dosing') and med.get('dose_schedule'))
+        else (med['name'], med['strength_value'], med['strength_unit'], med['source'] == 'manual')
+        for med in med_list
+    ]
+    cell_layouts = {}
+
+    # Generate calendar for current month and next month
+    for month_offset in range(2):
+        month = current_month + month_offset
+        year = current_year
+        if month > 12:
+            month = month - 12
+            year += 1
+
+        pdf.add_page()
+
+        # Page dimensions (A4 landscape: 297 x 210 mm)
+        page_width = 297
+        page_height = 210
+        margin = 10
+
+        # Title
+        pdf.set_font('Helvetica', 'B', 20)
+        pdf.set_text_color(25, 118, 210)
+        month_name = calendar.month_name[month]
+        pdf.cell(0, 12, f'{month_name} {year}', ln=True, align='C')
+
+        pdf.set_font('Helvetica', '', 9)
+        pdf.set_text_color(100, 100, 100)
+        pdf.cell(0, 5, 'Medication Schedule', ln=True, align='C')
+        pdf.ln(3)
+
+        # Calendar grid setup
+        col_width = (page_width - 2 * margin) / 7
+        header_height = 8
+        row_height = 28
+
+        # Day headers
+        days_of_week = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+        pdf.set_fill_color(25, 118, 210)
+        pdf.set_text_color(255, 255, 255)
+        pdf.set_font('Helvetica', 'B', 10)
+
+        for day_name in days_of_week:
+            pdf.cell(col_width, header_height, day_name, border=1, align='C', fill=True)
+        pdf.ln()
+
+        # Get calendar data
+        cal = calendar.Calendar(firstweekday=6)  # Sunday first
+        month_days = cal.monthdayscalendar(year, month)
+
+        # Draw calendar grid
+        for week in month_days:
+            y_row_start = pdf.get_y()
+
+            for day_idx, day in enumerate(week):
+                x_cell = margin + (day_idx * col_width)
+
+                # Cell background
+                if day == 0:
+                    pdf.set_fill_color(245, 245, 245)  # Gray for empty
+                elif day == today.day and month == today.month and year == today.year:
+                    pdf.set_fill_color(255, 253, 231)  # Yellow for today
+                else:
+                    pdf.set_fill_color(255, 255, 255)  # White
+
+                pdf.rect(x_cell, y_row_start, col_width, row_height, 'DF')
+                pdf.set_draw_color(200, 200, 200)
+                pdf.rect(x_cell, y_row_start, col_width, row_height, 'D')
+
+                if day != 0:
+                    # Day number
+                    pdf.set_xy(x_cell + 1, y_row_start + 1)
+                    pdf.set_font('Helvetica', 'B', 9)
+                    pdf.set_text_color(50, 50, 50)
+                    pdf.cell(col_width - 2, 5, str(day), align='L')
+
+                    # Calculate day offset from today for variable dosing
+                    cell_date = datetime(year, month, day)
+                    day_offset = (cell_date - today.replace(hour=0, minute=0, second=0, microsecond=0)).days
+
+                    # Medications for this day (skip past dates in current month)
+                    if not (month == today.month and year == today.year and day_offset < 0):
+                        # Identical (medication, dose) sets share one precomputed layout
+                        signature = tuple(
+                            entry or (med['name'], get_dose_for_day(med, day_offset), med['strength_unit'], med['source'] == 'manual')
+                            for med, entry in zip(med_list, fixed_entries)
+                        )
+                        layout = cell_layouts.get(signature)
+                        if layout is None:
+                            layout = plan_day_cell_layout(pdf, signature, col_width, row_height)
+                            cell_layouts[signature] = layout
+                        draw_day_cell_layout(pdf, layout, x_cell, y_row_start)
+
+            pdf.set_y(y_row_start + row_height)
+
+        # Legend
+        pdf.ln(3)
+        pdf.set_font('Helvetica', '', 7)
+        pdf.set_text_color(100, 100, 100)
+
+        # Legend items
+        legend_y = pdf.get_y()
+        pdf.set_fill_color(200, 230, 201)
+        pdf.rect(margin, legend_y, 4, 4, 'F')
+        pdf.set_xy(margin + 5, legend_y)
+        pdf.cell(30, 4, 'Database verified', align='L')
+
+        pdf.set_fill_color(255, 224, 178)
+        pdf.rect(margin + 40, legend_y, 4, 4, 'F')
+        pdf.set_xy(margin + 45, legend_y)
+        pdf.cell(30, 4, 'Manual entry', align='L')
+
+        pdf.set_fill_color(255, 253, 231)
+        pdf.rect(margin + 80, legend_y, 4, 4, 'F')
+        pdf.set_xy(margin + 85, legend_y)
+        pdf.cell(20, 4, 'Today', align='L')
+
+        # Medication list summary on right side of legend
+        pdf.set_xy(margin + 120, legend_y)
+        pdf.set_font('Helvetica', 'B', 7)
+        pdf.cell(0, 4, 'Medications: ', align='L')
+        pdf.set_font('Helvetica', '', 7)
+        med_summary = ', '.join([f"{m['name']} ({m['strength_value']}{m['strength_unit']})" for m in med_list[:4]])
+        if len(med_list) > 4:
+            med_summary += f' +{len(med_list) - 4} more'
+        pdf.set_xy(margin + 145, legend_y)
+        pdf.cell(0, 4, med_summary, align='L')
+
+    # Final page - detailed schedule
+    pdf.add_page()
+    pdf.set_font('Helvetica', 'B', 16)
+    pdf.set_text_color(25, 118, 210)
+    pdf.cell(0, 10, 'Daily Medication Schedule', ln=True, align='C')
+    pdf.ln(5)
+
+    # Time-based schedule table
+    time_slots = ['Morning (6-9 AM)', 'Noon (11AM-1PM)', 'Evening (5-7 PM)', 'Bedtime (9-11 PM)']
+    slot_keys = ['Morning', 'Noon', 'Evening', 'Bedtime']
+
+    pdf.set_fill_color(25, 118, 210)
+    pdf.set_text_color(255, 255, 255)
+    pdf.set_font('Helvetica', 'B', 10)
+    pdf.cell(70, 10, 'Time', border=1, align='C', fill=True)
+    pdf.cell(0, 10, 'Medications', border=1, align='C', fill=True)
+    pdf.ln()
+
+    pdf.set_text_color(0, 0, 0)
+    for i, slot_label in enumerate(time_slots):
+        slot_key = slot_keys[i]
+        meds_in_slot = [m for m in med_list if slot_key in m['time_slots']]
+
+        pdf.set_fill_color(245, 245, 245)
+        pdf.set_font('Helvetica', 'B', 9)
+        pdf.cell(70, 12, slot_label, border=1, align='C', fill=True)
+
+        pdf.set_fill_color(255, 255, 255)
+        pdf.set_font('Helvetica', '', 9)
+        if meds_in_slot:
+            med_text = ', '.join([f"{m['name']} {m['strength_value']} {m['strength_unit']}" for m in meds_in_slot])
+        else:
+            med_text = '-'
+        pdf.cell(0, 12, med_text, border=1, align='L', fill=True)
+        pdf.ln()
+
+    # Interaction alerts (batch records carry no IDs, so screen by list position)
+    alerts = screen_medications([{'id': str(i), 'name': m['name']} for i, m in enumerate(med_list)])
+    if alerts:
+        pdf.ln(6)
+        pdf.set_font('Helvetica', 'B', 10)
+        pdf.set_text_color(198, 40, 40)
+        pdf.cell(0, 7, 'Interaction alerts - review with the prescriber', ln=True, align='L')
+        pdf.set_font('Helvetica', '', 8)
+        pdf.set_text_color(0, 0, 0)
+        for alert in alerts:
+            pdf.multi_cell(0, 4.5, f"{alert.severity.upper()}: {alert.first_name} + {alert.second_name} - {alert.description}")
+
+    # Footer/disclaimer
+    pdf.ln(10)
+    pdf.set_font('Helvetica', 'I', 8)
+    pdf.set_text_color(100, 100, 100)
+    pdf.cell(0, 5, f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}', ln=True, align='C')
+
+    pdf.ln(3)
+    pdf.set_fill_color(255, 235, 238)
+    pdf.set_text_color(198, 40, 40)
+    pdf.set_font('Helvetica', 'B', 7)
+    pdf.multi_cell(0, 4,
+        "Experimental tool - not medical advice. Verify medication name, dose, route, and schedule against the patient's prescription. Must be reviewed by a licensed professional. Developer assumes no liability for errors, omissions, misuse, or outcomes.",
+        align='C', fill=True)
+
+    return pdf.output(dest='S').encode('latin-1')
+
+
+def pdf_cache_key(med_list, day):
+    """Digest of what the PDF shows: each entry's fields (list order included) and the day it's rendered."""
+    content = repr([
+        [(name, med[name]) for name in med.keys() if name not in PDF_KEY_IGNORED]
+        for med in med_list
+    ])
+    return 'pdf:' + hashlib.sha256(f"{day}|{content}".encode('utf-8')).hexdigest()
+
+
+def cached_pdf(med_list, backend=None):
+    """
+    generate_pdf(med_list), reused when the same list was rendered today
+    (its 'Generated' time is then the first render's).
+    """
+    backend = backend if backend is not None else (load_cache_backend() or PDF_MEMORY_CACHE)
+    key = pdf_cache_key(med_list, datetime.now().date().isoformat())
+    pdf_bytes = backend.get(key)
+    if pdf_bytes is None:
+        pdf_bytes = generate_pdf(med_list)
+        backend.set(key, pdf_bytes, PDF_CACHE_TTL_SECONDS)
+    return pdf_bytes
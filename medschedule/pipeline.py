@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Local-first search pipeline: one ranked, de-duplicated list per query.
+
+Stages run in order and later ones only when needed:
+
+    1. local      the catalogue (prefix table / incremental search)
+    2. cached     the DIN index, the shared Health Canada response cache
+                  and the session's last Health Canada results
+    3. remote     Health Canada itself, only when the first two found
+                  nothing and the caller allows it
+
+Every candidate is scored with the same ranking model, tagged with its
+source when it's created, and de-duplicated by the search key of its name
+in one set, the earliest stage winning (a catalogue name shadows the same
+name from Health Canada). The k best come back through one bounded heap.
+"""
+
+import contextlib
+import heapq
+
+from medschedule.database import MEDICATION_DATABASE
+from medschedule.din import load_din_index
+from medschedule.dpd import RESPONSE_CACHE, revalidate_din, revalidate_search, search_health_canada_api
+from medschedule.ranking import load_ranker, match_quality
+from medschedule.records import SearchResult
+from medschedule.search import IncrementalSearch
+from medschedule.textkey import search_key
+
+LOCAL_SOURCE = 'Local Database'
+REMOTE_SOURCE = 'Health Canada API'
+
+# Remote lookups from as-you-type search: not for one or two characters, and not for long
+REMOTE_MIN_LENGTH = 3
+REMOTE_DEADLINE_SECONDS = 5
+# A DIN match ranks above any name match
+DIN_MATCH_SCORE = 2.0
+
+
+class SearchPipeline:
+    """
+    Per-session search state: the incremental local search, the session's
+    Health Canada results (keyed once) and the last remote query, so typing
+    further into a query Health Canada already answered filters that answer
+    instead of asking again.
+    """
+
+    def __init__(self, lang='en'):
+        self.lang = lang
+        self.local = IncrementalSearch()
+        self._remote = []
+        self._remote_query = None
+        self.remote_lookups = 0
+
+    def set_remote(self, results, lang=None, query=None):
+        """Results of an explicit Health Canada search, searched from now on as the session's cache."""
+        if lang is not None:
+            self.lang = lang
+        self._remote = [(search_key(result['brand_name']), result) for result in results]
+        self._remote_query = query
+
+    def search(self, query_upper, k=10, remote=False, cache=RESPONSE_CACHE, dins=None, remote_context=None):
+        """
+        ([(result, equivalent_of)], error) for a search key, best first.
+        equivalent_of is the catalogue name that brought in a brand/generic
+        equivalent, else None. error is only set by a failed remote stage.
+        remote_context, if given, is called for a context manager wrapped
+        around the Health Canada call only (e.g. a spinner).
+        """
+        if not query_upper:
+            return [], None
+        ranker = load_ranker()
+        candidates = []
+
+        # 1. Local catalogue
+        for row, via in self.local.search(query_upper, k):
+            result = SearchResult(
+                brand_name=MEDICATION_DATABASE.brand_name(row),
+                company=MEDICATION_DATABASE.company(row),
+                category=MEDICATION_DATABASE.category(row),
+                source=LOCAL_SOURCE,
+                drug_code='',
+                din='',
+            )
+            equivalent_of = MEDICATION_DATABASE.brand_name(via) if via is not None else None
+            candidates.append((ranker.row_score(query_upper, row, via), MEDICATION_DATABASE.key(row), result, equivalent_of))
+
+        # 2. DIN index, shared response cache, the session's results
+        dins = dins if dins is not None else load_din_index()
+        # A full DIN, or one typed without its leading zero; '0223994' is still being typed
+        if query_upper.isdigit() and (len(query_upper) == 8 or (len(query_upper) == 7 and query_upper[0] != '0')):
+            known = dins.get(query_upper, revalidate_din(query_upper, self.lang, dins))
+            if known is not None:
+                candidates.append((DIN_MATCH_SCORE, search_key(known['brand_name']), known, None))
+        # Stale answers count too; they're refreshed in the background
+        cached = cache.get(self.lang, query_upper, revalidate_search(query_upper, self.lang, dins=dins)) if cache is not None else None
+        keyed = [(search_key(result['brand_name']), result) for result in cached or ()]
+        keyed += [(key, result) for key, result in self._remote if query_upper in key]
+
+        # 3. Health Canada, only on a miss
+        error = None
+        if (
+            remote and not candidates and cached is None and not keyed
+            and len(query_upper) >= REMOTE_MIN_LENGTH and not self._answered(query_upper)
+        ):
+            with remote_context() if remote_context is not None else contextlib.nullcontext():
+                results, error = search_health_canada_api(
+                    query_upper, self.lang, cache=cache, deadline=REMOTE_DEADLINE_SECONDS, dins=dins,
+                )
+            self.remote_lookups += 1
+            if not error:
+                self.set_remote(results)
+                keyed = list(self._remote)
+            # Extensions of a query that failed or came back empty don't ask again
+            self._remote_query = query_upper
+
+        for key, result in keyed:
+            candidates.append((ranker.score(match_quality(query_upper, key), result['brand_name']), key, result, None))
+
+        # One set of name keys, earliest stage first
+        seen = set()
+        unique = []
+        for order, (score, key, result, equivalent_of) in enumerate(candidates):
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append((score, -order, result, equivalent_of))
+        return [(result, equivalent_of) for _, _, result, equivalent_of in heapq.nlargest(k, unique)], error
+
+    def _answered(self, query_upper):
+        """Whether the last remote query covers this one (every name containing this contains it)."""
+        return self._remote_query is not None and query_upper.startswith(self._remote_query)
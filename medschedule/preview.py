@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+HTML calendar and table previews of a medication schedule.
+"""
+
+from datetime import datetime, timedelta
+
+from medschedule.schedule import get_dose_for_day
+
+
+def generate_calendar_html(med_list):
+    """Generate an HTML calendar view of the medication schedule."""
+    if not med_list:
+        return "<p>No medications to display.</p>"
+
+    today = datetime.now()
+    days = [(today + timedelta(days=i)) for i in range(7)]
+    day_names = [d.strftime("%a %m/%d") for d in days]
+
+    time_slots = ['Morning', 'Noon', 'Evening', 'Bedtime']
+    time_labels = {
+        'Morning': 'Morning<br>(6-9 AM)',
+        'Noon': 'Noon<br>(11AM-1PM)',
+        'Evening': 'Evening<br>(5-7 PM)',
+        'Bedtime': 'Bedtime<br>(9-11 PM)'
+    }
+
+    html = '<div class="calendar-container"><table class="calendar-table">'
+    html += '<tr><th>Time</th>'
+    for day_name in day_names:
+        html += f'<th>{day_name}</th>'
+    html += '</tr>'
+
+    for slot in time_slots:
+        html += f'<tr><td class="time-header">{time_labels[slot]}</td>'
+        for day_idx, _ in enumerate(days):
+            html += '<td>'
+            for med in med_list:
+                if slot in med['time_slots']:
+                    card_class = 'calendar-med manual' if med['source'] == 'manual' else 'calendar-med'
+                    # Get dose for this specific day (supports variable dosing)
+                    day_dose = get_dose_for_day(med, day_idx)
+                    # Add indicator if dose is changing
+                    dose_indicator = ""
+                    if med.get('variable_dosing') and med.get('dose_schedule'):
+                        prev_dose = get_dose_for_day(med, day_idx - 1) if day_idx > 0 else day_dose
+                        if day_dose < prev_dose:
+                            dose_indicator = " ↓"
+                        elif day_dose > prev_dose:
+                            dose_indicator = " ↑"
+                    html += f'''
+                    <div class="{card_class}">
+                        <div class="med-title">{med['name']}</div>
+                        <div class="med-dose">{day_dose} {med['strength_unit']}{dose_indicator}</div>
+                    </div>
+                    '''
+            html += '</td>'
+        html += '</tr>'
+
+    html += '</table></div>'
+    return html
+
+
+def generate_preview_html(med_list):
+    """Generate an HTML preview of the PDF schedule."""
+    if not med_list:
+        return ""
+
+    time_slots = ['Morning', 'Noon', 'Evening', 'Bedtime']
+
+    html = '''
+    <div class="preview-container">
+        <div class="preview-header">PDF Preview - Medication Schedule</div>
+        <table style="width:100%; border-collapse: collapse; margin-top: 10px;">
+            <tr style="background-color: #1976d2; color: white;">
+                <th style="padding: 10px; border: 1px solid #1565c0; text-align: left;">Medication</th>
+                <th style="padding: 10px; border: 1px solid #1565c0; text-align: center;">Morning</th>
+                <th style="padding: 10px; border: 1px solid #1565c0; text-align: center;">Noon</th>
+                <th style="padding: 10px; border: 1px solid #1565c0; text-align: center;">Evening</th>
+                <th style="padding: 10px; border: 1px solid #1565c0; text-align: center;">Bedtime</th>
+            </tr>
+    '''
+
+    for med in med_list:
+        bg_color = '#fff3e0' if med['source'] == 'manual' else '#e8f5e9'
+        source_label = ' (Manual)' if med['source'] == 'manual' else ''
+
+        html += f'''
+            <tr style="background-color: {bg_color};">
+                <td style="padding: 10px; border: 1px solid #e0e0e0;">
+                    <strong>{med['name']}</strong>{source_label}<br>
+                    <span style="color: #616161;">{med['strength_value']} {med['strength_unit']}</span>
+                </td>
+        '''
+
+        for slot in time_slots:
+            if slot in med['time_slots']:
+                html += f'''
+                    <td style="padding: 10px; border: 1px solid #e0e0e0; text-align: center; background-color: #c8e6c9;">
+                        <strong>X</strong><br>
+                        <span style="font-size: 0.8rem;">{med['strength_value']} {med['strength_unit']}</span>
+                    </td>
+                '''
+            else:
+                html += '<td style="padding: 10px; border: 1px solid #e0e0e0; text-align: center; color: #bdbdbd;">-</td>'
+
+        html += '</tr>'
+
+    html += f'''
+        </table>
+        <div style="margin-top: 15px; padding: 10px; background-color: #fff8e1; border-radius: 4px; font-size: 0.85rem;">
+            <strong>Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M")}<br>
+            <em>Experimental tool - not medical advice. Verify medication name, dose, route, and schedule against the patient's prescription. Must be reviewed by a licensed professional. Developer assumes no liability for errors, omissions, misuse, or outcomes.</em>
+        </div>
+    </div>
+    '''
+    return html
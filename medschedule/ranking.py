@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Search result ranking: match quality weighted by a popularity prior.
+
+Match quality (1.0 best):
+
+    exact name                        1.0
+    name starts with the query        0.8, slightly more for shorter names
+    a later word starts with it       0.6
+    substring elsewhere               0.4
+    name starts with a typo of it     up to 0.3 (one edit per 4 characters; a swap is one edit)
+
+The popularity prior (0..1) is computed once per process from the catalogue:
+IQVIA ranks noted in the category ("Blood Pressure - #9 in Canada") score
+highest and are shared, slightly discounted, by the other names of the same
+ingredient group (NORVASC inherits from AMLODIPINE); otherwise the row's
+position counts, since the catalogue is ordered most-dispensed first.
+
+Queries and names are compared as search keys (medschedule.textkey), so
+'lévothyroxine' ranks LEVOTHYROXINE as an exact match. Callers hand over
+candidate matches and get the k best back through heapq.nlargest, so
+ranking costs O(n log k) instead of a full sort.
+"""
+
+import functools
+import heapq
+import re
+
+from medschedule.database import MEDICATION_DATABASE
+from medschedule.equivalents import load_equivalence_index, normalize_name
+
+QUALITY_WEIGHT = 0.7
+PRIOR_WEIGHT = 0.3
+
+# Equivalents of a hit rank as a fraction of the hit's own match quality
+EQUIVALENT_DISCOUNT = 0.5
+# Share of an ingredient's best explicit rank given to its other names
+GROUP_PRIOR_DISCOUNT = 0.8
+# Ceiling of the position-based prior for rows without an explicit rank
+POSITION_PRIOR_MAX = 0.3
+# Leading characters of each name indexed for the typo search
+FUZZY_PREFIX = 16
+
+_RANK = re.compile(r'#(\d+)\b')
+
+
+def rank_prior(rank):
+    """#1 -> 1.0, #10 -> 0.5, falling off slowly after."""
+    return 1.0 / (1.0 + (rank - 1) / 9.0)
+
+
+def edit_distance(a, b, limit):
+    """
+    Edit distance of a and b counting an adjacent swap as one edit (optimal
+    string alignment), or limit + 1 once it must exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+def match_quality(query_upper, name):
+    """Quality of a direct (substring) match; 0.0 if query_upper isn't in name."""
+    if name == query_upper:
+        return 1.0
+    if name.startswith(query_upper):
+        return 0.8 + 0.2 * len(query_upper) / len(name)
+    position = name.find(query_upper)
+    if position < 0:
+        return 0.0
+    if not name[position - 1].isalnum():
+        return 0.6
+    return 0.4
+
+
+def bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def fuzzy_limit(query_upper):
+    """Edits tolerated for a query: one per four characters, none below four characters."""
+    return len(query_upper) // 4
+
+
+def fuzzy_quality(query_upper, name, limit):
+    """Typo tolerance: compare the query with the name's start of the same length."""
+    if limit < 1:
+        return 0.0
+    distance = edit_distance(query_upper, name[:len(query_upper)], limit)
+    if distance > limit:
+        return 0.0
+    return 0.3 * (1.0 - distance / (limit + 1))
+
+
+class Ranker:
+    """Popularity priors for the catalogue plus the scoring model above."""
+
+    def __init__(self, catalogue=MEDICATION_DATABASE, index=None):
+        index = index or load_equivalence_index()
+        self._catalogue = catalogue
+        self._index = index
+        rows = len(catalogue)
+
+        # Explicit IQVIA ranks, and the best rank per ingredient group
+        explicit = {}
+        group_best = {}
+        for i in range(rows):
+            found = _RANK.search(catalogue.category(i))
+            if found:
+                prior = rank_prior(int(found.group(1)))
+                explicit[i] = max(explicit.get(i, 0.0), prior)
+                group = index.group_of_row(i)
+                if group >= 0:
+                    group_best[group] = max(group_best.get(group, 0.0), prior)
+        self._group_prior = {group: prior * GROUP_PRIOR_DISCOUNT for group, prior in group_best.items()}
+
+        # A name keeps the best prior of any of its rows (ATORVASTATIN is listed twice)
+        self._name_prior = {}
+        self._first_row = {}
+        for i in range(rows):
+            name = catalogue.key(i)
+            prior = max(
+                explicit.get(i, 0.0),
+                self._group_prior.get(index.group_of_row(i), 0.0),
+                POSITION_PRIOR_MAX * (1.0 - i / rows),
+            )
+            self._name_prior[name] = max(self._name_prior.get(name, 0.0), prior)
+            self._first_row.setdefault(catalogue.key(i), i)
+        self._row_prior = [self._name_prior[catalogue.key(i)] for i in range(rows)]
+
+        # Bigram -> name keys, so the typo search only runs edit distance on plausible names
+        self._bigram_names = {}
+        for key in self._first_row:
+            for gram in bigrams(key[:FUZZY_PREFIX]):
+                self._bigram_names.setdefault(gram, []).append(key)
+
+    def prior(self, name):
+        """Popularity prior of a catalogue name, or of a free-text name through its ingredient."""
+        key = normalize_name(name)
+        prior = self._name_prior.get(key)
+        if prior is not None:
+            return prior
+        ingredient = self._index.ingredient(key)
+        if ingredient is None:
+            return 0.0
+        return self._name_prior.get(ingredient, 0.0) * GROUP_PRIOR_DISCOUNT
+
+    def score(self, quality, name):
+        return QUALITY_WEIGHT * quality + PRIOR_WEIGHT * self.prior(name)
+
+    def top_rows(self, query_upper, expanded, k):
+        """
+        The k best (row, via) pairs from expand_rows() output, best first.
+
+        Direct hits score by match quality (or typo distance, for rows from
+        fuzzy_rows()), equivalents by a discounted quality of the hit that
+        brought them in; ties go to the earlier row.
+        """
+        limit = fuzzy_limit(query_upper)
+        scored = [(self.row_score(query_upper, row, via, limit), -row, row, via) for row, via in expanded]
+        return [(row, via) for _, _, row, via in heapq.nlargest(k, scored)]
+
+    def row_score(self, query_upper, row, via=None, limit=None):
+        """Score of a catalogue row for top_rows() (limit: fuzzy_limit(query_upper), if already known)."""
+        matched = self._catalogue.key(row if via is None else via)
+        if limit is None:
+            limit = fuzzy_limit(query_upper)
+        quality = match_quality(query_upper, matched) or fuzzy_quality(query_upper, matched, limit)
+        if via is not None:
+            quality *= EQUIVALENT_DISCOUNT
+        return QUALITY_WEIGHT * quality + PRIOR_WEIGHT * self._row_prior[row]
+
+    def fuzzy_rows(self, query_upper):
+        """Rows (one per name) whose start is within fuzzy_limit() edits of the query."""
+        limit = fuzzy_limit(query_upper)
+        if limit < 1:
+            return []
+        # Each edit breaks at most three of the query's bigrams (a swap: the pair and both neighbours)
+        grams = bigrams(query_upper)
+        needed = len(grams) - 3 * limit
+        if needed > 0:
+            shared = {}
+            for gram in grams:
+                for name in self._bigram_names.get(gram, ()):
+                    shared[name] = shared.get(name, 0) + 1
+            names = [name for name, count in shared.items() if count >= needed]
+        else:
+            names = self._first_row
+        return [
+            self._first_row[name] for name in names
+            if fuzzy_quality(query_upper, name, limit) > 0
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def load_ranker():
+    """Build the priors once per process; every session shares them."""
+    return Ranker()
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Compact record types for per-session data.
+
+Medication (entries of med_list), SearchResult (local and Health Canada
+search hits), ProductDetails (Health Canada details of a selected
+product), InteractionAlert (interaction screen results) and
+DoseViolation (daily-limit guardrail results) are frozen, slotted
+dataclasses: no per-instance __dict__, and categorical string
+fields (company, category, source, unit, time slots, severity, dosage
+forms, routes) are interned so every session shares one copy of
+'Various', 'Health Canada DPD', 'mg', 'Morning', ...
+
+All keep read-only mapping access (record['name'], record.get('source'),
+{**record}) so code written against the previous dicts keeps working.
+"""
+
+import sys
+from dataclasses import dataclass
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class _MappingAccess:
+    """Read-only dict-style access to dataclass fields."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__dataclass_fields__
+
+    def get(self, key, default=None):
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return self.__dataclass_fields__.keys()
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+    def to_tuple(self):
+        """Compact positional form (field order) for storage and caches."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_tuple(cls, values):
+        return cls(*values)
+
+    def __reduce__(self):
+        # Frozen slotted dataclasses can't be restored by the default setattr-based unpickling
+        return (self.__class__, self.to_tuple())
+
+
+@dataclass(frozen=True, eq=True)
+class SearchResult(_MappingAccess):
+    """One medication search hit. drug_code and din are '' for local catalogue hits."""
+
+    __slots__ = ('brand_name', 'company', 'category', 'source', 'drug_code', 'din')
+
+    brand_name: str
+    company: str
+    category: str
+    source: str
+    drug_code: str
+    din: str
+
+    def __post_init__(self):
+        object.__setattr__(self, 'company', _intern(self.company))
+        object.__setattr__(self, 'category', _intern(self.category))
+        object.__setattr__(self, 'source', _intern(self.source))
+
+
+@dataclass(frozen=True, eq=True)
+class Medication(_MappingAccess):
+    """One entry of the patient medication list. Immutable once added."""
+
+    __slots__ = (
+        'id', 'name', 'strength_value', 'strength_unit', 'time_slots', 'source',
+        'added_at', 'variable_dosing', 'dose_schedule',
+    )
+
+    id: str
+    name: str
+    strength_value: float
+    strength_unit: str
+    time_slots: tuple
+    source: str
+    added_at: str
+    variable_dosing: bool
+    dose_schedule: object
+
+    def __post_init__(self):
+        object.__setattr__(self, 'strength_unit', _intern(self.strength_unit))
+        object.__setattr__(self, 'time_slots', tuple(_intern(slot) for slot in self.time_slots))
+        object.__setattr__(self, 'source', _intern(self.source))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a med_list-style dict; missing optional fields get their defaults."""
+        return cls(
+            id=data['id'],
+            name=data['name'],
+            strength_value=data['strength_value'],
+            strength_unit=data['strength_unit'],
+            time_slots=tuple(data.get('time_slots', ())),
+            source=data.get('source', 'database'),
+            added_at=data.get('added_at', ''),
+            variable_dosing=bool(data.get('variable_dosing', False)),
+            dose_schedule=data.get('dose_schedule'),
+        )
+
+
+@dataclass(frozen=True, eq=True)
+class InteractionAlert(_MappingAccess):
+    """One interacting pair on a medication list; first_* is the entry added earlier."""
+
+    __slots__ = ('severity', 'first_id', 'second_id', 'first_name', 'second_name', 'description')
+
+    severity: str
+    first_id: str
+    second_id: str
+    first_name: str
+    second_name: str
+    description: str
+
+    def __post_init__(self):
+        object.__setattr__(self, 'severity', _intern(self.severity))
+        object.__setattr__(self, 'description', _intern(self.description))
+
+
+@dataclass(frozen=True, eq=True)
+class DoseViolation(_MappingAccess):
+    """Days on which one ingredient's summed daily dose exceeds its maximum (days are offsets from today)."""
+
+    __slots__ = ('ingredient', 'unit', 'max_daily', 'peak_total', 'days', 'med_ids')
+
+    ingredient: str
+    unit: str
+    max_daily: float
+    peak_total: float
+    days: tuple
+    med_ids: tuple
+
+    def __post_init__(self):
+        object.__setattr__(self, 'unit', _intern(self.unit))
+
+
+@dataclass(frozen=True, eq=True)
+class ProductDetails(_MappingAccess):
+    """
+    Health Canada details of one product (drug code): active ingredients
+    as (name, strength, unit) tuples, dosage forms and routes.
+    """
+
+    __slots__ = ('drug_code', 'ingredients', 'dosage_forms', 'routes')
+
+    drug_code: str
+    ingredients: tuple
+    dosage_forms: tuple
+    routes: tuple
+
+    def __post_init__(self):
+        object.__setattr__(self, 'dosage_forms', tuple(_intern(form) for form in self.dosage_forms))
+        object.__setattr__(self, 'routes', tuple(_intern(route) for route in self.routes))
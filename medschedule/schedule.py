@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Dose schedule helpers shared by the Streamlit UI, PDF export and batch tools.
+"""
+
+from datetime import datetime, timedelta
+
+
+def generate_dose_schedule(start_dose, target_dose, step_amount, days_per_step):
+    """
+    Generates a list of dates and doses.
+    """
+    schedule = []
+    current_dose = start_dose
+    current_date = datetime.now().date()
+
+    if start_dose > target_dose:
+        direction = -1  # Taper
+    else:
+        direction = 1  # Increase
+
+    keep_calculating = True
+    while keep_calculating:
+        schedule.append({
+            "date": current_date,
+            "dose": current_dose,
+            "duration_days": days_per_step
+        })
+
+        next_dose = current_dose + (step_amount * direction)
+
+        if (direction == -1 and next_dose <= target_dose) or \
+           (direction == 1 and next_dose >= target_dose):
+            current_dose = target_dose
+            keep_calculating = False
+            schedule.append({
+                "date": current_date + timedelta(days=days_per_step),
+                "dose": current_dose,
+                "note": "Target Reached"
+            })
+        else:
+            current_dose = next_dose
+            current_date = current_date + timedelta(days=days_per_step)
+
+    return schedule
+
+
+def get_dose_for_day(med, day_offset):
+    """Get the dose for a medication on a specific day (0 = today, 1 = tomorrow, etc.)."""
+    if not med.get('variable_dosing') or not med.get('dose_schedule'):
+        return med['strength_value']
+
+    schedule = med['dose_schedule']
+
+    if schedule['type'] == 'gradual':
+        # Find which step we're on based on day offset
+        steps = schedule.get('steps', [])
+        if not steps:
+            return med['strength_value']
+
+        # Find the appropriate step for this day
+        current_dose = steps[0]['dose']
+        for step in steps:
+            if day_offset >= step['day']:
+                current_dose = step['dose']
+            else:
+                break
+        return current_dose
+
+    elif schedule['type'] == 'custom':
+        # Check custom date ranges (day 1 = today, so offset 0 = day 1)
+        day_num = day_offset + 1
+        ranges = schedule.get('ranges', [])
+        for r in ranges:
+            if r['start_day'] <= day_num <= r['end_day']:
+                return r['dose']
+        # If no range matches, return the base strength
+        return med['strength_value']
+
+    return med['strength_value']
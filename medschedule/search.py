@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Local medication search over the bundled database.
+
+Queries and names are compared as search keys (medschedule.textkey):
+query_upper arguments are search_key() of what was typed, and the
+catalogue stores the key of every name, so 'lévothyroxine' and
+'Levothyroxine' find the same rows.
+
+Queries of up to PREFIX_LENGTH characters match most of the catalogue,
+so ranking them is the most expensive search and also the most frequent
+one (every search starts with them). Their ranked results are
+precomputed once per process for every 1..PREFIX_LENGTH character string
+that occurs in a name; a short query is then a single dict lookup.
+"""
+
+import functools
+
+from medschedule.database import MEDICATION_DATABASE
+from medschedule.equivalents import expand_rows
+from medschedule.ranking import load_ranker
+from medschedule.records import SearchResult
+from medschedule.textkey import search_key
+
+MAX_RESULTS = 20
+# Queries up to this length are answered from the precomputed prefix table
+PREFIX_LENGTH = 3
+
+
+def rank_hits(query_upper, hits, k=MAX_RESULTS):
+    """
+    The k best catalogue matches as (row, via) pairs, best first.
+
+    hits are the rows whose name contains the query; candidates are those
+    plus their brand/generic equivalents (via is the hit that brought an
+    equivalent in). Near-miss spellings are looked up only when nothing
+    contains the query, since that scan costs more than the substring
+    search. Ranked by match quality and popularity with a bounded heap.
+    """
+    ranker = load_ranker()
+    if not hits:
+        hits = ranker.fuzzy_rows(query_upper)
+    return ranker.top_rows(query_upper, expand_rows(hits), k)
+
+
+def build_prefix_table(catalogue=MEDICATION_DATABASE, length=PREFIX_LENGTH, k=MAX_RESULTS):
+    """
+    {query: ranked (row, via) pairs} for every string of 1..length
+    characters found in a catalogue name's key, the same results rank_hits()
+    gives for it. Strings found in no name aren't stored: they have no
+    hits, and queries that short are too short for the typo search.
+    """
+    hits = {}
+    for row in range(len(catalogue)):
+        key = catalogue.key(row)
+        found = {key[i:i + n] for n in range(1, length + 1) for i in range(len(key) - n + 1)}
+        for query in found:
+            # Rows are visited in order, so each list is ascending like find()
+            hits.setdefault(query, []).append(row)
+    return {query: tuple(rank_hits(query, rows, k)) for query, rows in hits.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def load_prefix_table():
+    """Build the short-query table once per process; every session shares it."""
+    return build_prefix_table()
+
+
+def search_rows(query_upper, k=MAX_RESULTS):
+    """rank_hits() over a full catalogue lookup, or the prefix table for short queries."""
+    if len(query_upper) <= PREFIX_LENGTH and k <= MAX_RESULTS:
+        # The top k are the first k of the stored top MAX_RESULTS
+        return list(load_prefix_table().get(query_upper, ())[:k])
+    return rank_hits(query_upper, MEDICATION_DATABASE.find(query_upper), k)
+
+
+class IncrementalSearch:
+    """
+    As-you-type search state for one input (kept per session).
+
+    Remembers the last query and the rows whose name contains it. When the
+    next query extends it ("AT" -> "ATO"), only those rows are filtered;
+    any other edit (backspace, replacement) does a full catalogue lookup.
+    Short queries come from the prefix table, which keeps no hits, so the
+    first longer query after one does a full lookup. Reruns with an
+    unchanged query reuse the last ranked results.
+    """
+
+    def __init__(self):
+        self.query = ''
+        self._hits = None
+        self._results = {}
+        self.full_lookups = 0
+        self.narrowed_lookups = 0
+        self.prefix_lookups = 0
+
+    def search(self, query_upper, k=MAX_RESULTS):
+        if query_upper == self.query and k in self._results:
+            return self._results[k]
+        if len(query_upper) <= PREFIX_LENGTH and k <= MAX_RESULTS:
+            self.query = query_upper
+            self._hits = None
+            self._results = {k: search_rows(query_upper, k)}
+            self.prefix_lookups += 1
+            return self._results[k]
+        if self._hits is not None and query_upper.startswith(self.query):
+            # Every name containing the longer query contains the previous one
+            hits = [row for row in self._hits if query_upper in MEDICATION_DATABASE.key(row)]
+            self.narrowed_lookups += 1
+        else:
+            hits = MEDICATION_DATABASE.find(query_upper)
+            self.full_lookups += 1
+        self.query = query_upper
+        self._hits = hits
+        self._results = {k: rank_hits(query_upper, hits, k)}
+        return self._results[k]
+
+
+def search_medications(query):
+    """Search local medication database - instant results, ranked, with brand/generic equivalents."""
+    if not query or len(query) < 1:
+        return []
+
+    return [
+        SearchResult(
+            brand_name=MEDICATION_DATABASE.brand_name(i),
+            company=MEDICATION_DATABASE.company(i),
+            category=MEDICATION_DATABASE.category(i),
+            source='Local Database',
+            drug_code='',
+            din='',
+        )
+        for i, _ in search_rows(search_key(query))
+    ]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Writable directory for runtime data (the DIN store, the query log).
+
+Nothing is written inside the package, which may be read-only
+(site-packages, a container image). The directory is
+MEDSCHEDULE_STATE_DIR if set, else medschedule/ under the user's cache
+directory ($XDG_CACHE_HOME or ~/.cache; %LOCALAPPDATA% on Windows). Point
+several processes of one deployment at the same directory to share the
+files; writers take an exclusive lock on a side file (locked()), so
+appends and rewrites from different processes never interleave.
+"""
+
+import contextlib
+import os
+import sys
+
+STATE_DIR_VARIABLE = 'MEDSCHEDULE_STATE_DIR'
+
+
+def state_dir():
+    """The runtime data directory, created if needed; None if it can't be."""
+    path = os.environ.get(STATE_DIR_VARIABLE, '').strip()
+    if not path:
+        if sys.platform == 'win32':
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        path = os.path.join(base, 'medschedule')
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+
+def state_path(name):
+    """Path of a runtime data file, or None if there's no writable directory."""
+    directory = state_dir()
+    return os.path.join(directory, name) if directory else None
+
+
+@contextlib.contextmanager
+def locked(path):
+    """Hold an exclusive cross-process lock for path (on path + '.lock') while the block runs."""
+    with open(path + '.lock', 'a+b') as f:
+        if sys.platform == 'win32':
+            import msvcrt
+
+            f.seek(0)
+            # LK_LOCK retries for ~10 s before raising OSError
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
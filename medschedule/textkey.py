@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Accent- and case-insensitive search keys for English and French names.
+
+    'Lévothyroxine sodique' -> 'LEVOTHYROXINE SODIQUE'
+    'Fluticasone/Salmétérol' -> 'FLUTICASONE SALMETEROL'
+    'tylenol #3'            -> 'TYLENOL 3'
+
+Keys are casefolded and stripped of accents (NFKD, combining marks
+dropped, œ/æ spelled out); punctuation becomes a single space and the
+result is upper-cased to match the catalogue's names. The catalogue
+stores the key of every name (see medschedule.catalogue) and Health
+Canada responses are keyed once when they arrive, so a search normalizes
+only its query.
+"""
+
+import re
+import unicodedata
+
+_SEPARATORS = re.compile(r'[\W_]+')
+# Ligatures that don't decompose (cœur, Cæsar)
+_LIGATURES = str.maketrans({'œ': 'oe', 'æ': 'ae'})
+
+
+def search_key(text):
+    """The search key of text ('' for None or blank)."""
+    if not text:
+        return ''
+    if not text.isascii():
+        text = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+        text = text.casefold().translate(_LIGATURES)
+    return _SEPARATORS.sub(' ', text.casefold()).strip().upper()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Query log and startup cache warmer.
+
+A restart empties the Health Canada response cache, so the first
+searches of the day would all wait on the DPD. The query log counts
+settled Health Canada queries per language, by search key
+(medschedule.textkey): a Browse search, or the inline query a Health
+Canada result was picked from, once each, never every keystroke or
+rerun. Aggregate counts only, no sessions, users or times. At startup
+start_warmup() loads the local search index on the calling thread and
+prefetches the most frequent queries into the response cache on a
+background thread, a few per second so the DPD isn't hammered.
+
+query_counts.csv (lang, query, count) in the state directory
+(medschedule.statedir) is rewritten every few searches. A flush merges
+this process's new counts into what's on disk under the file's lock, so
+processes sharing the directory add up instead of overwriting each
+other; if there's no writable directory the log keeps counting in memory.
+"""
+
+import functools
+import os
+import threading
+import time
+
+from medschedule.din import load_din_index
+from medschedule.dpd import DPD_LANGUAGES, RESPONSE_CACHE, search_health_canada_api
+from medschedule.search import load_prefix_table
+from medschedule.statedir import locked, state_path
+from medschedule.textkey import search_key
+
+QUERY_LOG_NAME = 'query_counts.csv'
+QUERY_LOG_FIELDS = ('lang', 'query', 'count')
+# Keys shorter than a remote lookup or longer than a drug name aren't worth keeping
+MIN_LOGGED_LENGTH = 3
+MAX_LOGGED_LENGTH = 40
+# Rarest queries are dropped beyond this
+MAX_LOGGED_QUERIES = 5000
+FLUSH_EVERY = 25
+
+WARM_TOP_N = 50
+WARM_QUERIES_PER_SECOND = 2
+WARM_DEADLINE_SECONDS = 20
+
+
+class QueryLog:
+    """Thread-safe (lang, search key) -> count, flushed to a CSV store (path None: memory only)."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._counts = {}
+        # Counts recorded here since the last flush
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.writable = True
+        if path and os.path.exists(path):
+            self._counts = read_query_counts(path)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def record(self, query, lang='en'):
+        """Count one Health Canada search of query."""
+        key = search_key(query)
+        if lang not in DPD_LANGUAGES or not MIN_LOGGED_LENGTH <= len(key) <= MAX_LOGGED_LENGTH:
+            return
+        with self._lock:
+            self._counts[lang, key] = self._counts.get((lang, key), 0) + 1
+            self._pending[lang, key] = self._pending.get((lang, key), 0) + 1
+            if sum(self._pending.values()) >= FLUSH_EVERY:
+                self._flush()
+
+    def top(self, n=WARM_TOP_N):
+        """The n most searched (lang, search key) pairs, most searched first."""
+        with self._lock:
+            counts = list(self._counts.items())
+        counts.sort(key=lambda entry: -entry[1])
+        return [query for query, _ in counts[:n]]
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        # Called with the lock held
+        if not self.path or not self.writable:
+            self._pending = {}
+            self._counts = _trimmed(self._counts)
+            return
+        import csv
+
+        try:
+            # Other processes flush to the same file: add our counts to theirs
+            with locked(self.path):
+                counts = read_query_counts(self.path) if os.path.exists(self.path) else {}
+                for query, count in self._pending.items():
+                    counts[query] = counts.get(query, 0) + count
+                counts = _trimmed(counts)
+                # Rewritten whole, then swapped in, so a reader never sees half a file
+                temp_path = self.path + '.tmp'
+                with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(QUERY_LOG_FIELDS)
+                    for (lang, key), count in counts.items():
+                        writer.writerow([lang, key, count])
+                os.replace(temp_path, self.path)
+        except OSError:
+            # No writable directory: keep counting in memory
+            self.writable = False
+            self._pending = {}
+            self._counts = _trimmed(self._counts)
+            return
+        self._pending = {}
+        self._counts = counts
+
+
+def _trimmed(counts):
+    """counts, without the rarest queries beyond MAX_LOGGED_QUERIES."""
+    if len(counts) <= MAX_LOGGED_QUERIES:
+        return counts
+    return dict(sorted(counts.items(), key=lambda entry: -entry[1])[:MAX_LOGGED_QUERIES])
+
+
+def read_query_counts(path):
+    import csv
+
+    with open(path, newline='', encoding='utf-8') as f:
+        return {
+            (row['lang'], row['query']): int(row['count'])
+            for row in csv.DictReader(f)
+            if row.get('lang') in DPD_LANGUAGES and row.get('query') and (row.get('count') or '').isdigit()
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def load_query_log(path=None):
+    """Load the query log once per process (from query_counts.csv in the state directory by default); every session shares it."""
+    return QueryLog(path if path is not None else state_path(QUERY_LOG_NAME))
+
+
+def warm_cache(queries, rate=WARM_QUERIES_PER_SECOND, cache=RESPONSE_CACHE, search=search_health_canada_api):
+    """
+    Search each (lang, search key) so its answer is in the response cache,
+    at most `rate` searches a second. Returns how many were searched;
+    failures are skipped (the query is searched again when someone asks).
+    """
+    interval = 1.0 / rate if rate else 0.0
+    searched = 0
+    for lang, key in queries:
+        started = time.monotonic()
+        try:
+            search(key, lang, cache=cache, deadline=WARM_DEADLINE_SECONDS)
+        except Exception:
+            pass
+        searched += 1
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    return searched
+
+
+@functools.lru_cache(maxsize=None)
+def start_warmup(top_n=WARM_TOP_N):
+    """
+    Once per process: build the local search index (prefix table, ranker,
+    equivalents) and load the DIN index now, then warm the response cache
+    with the top_n most searched queries on a daemon thread. Returns the
+    thread, or None if there's nothing to warm.
+    """
+    load_prefix_table()
+    load_din_index()
+    queries = load_query_log().top(top_n)
+    if not queries:
+        return None
+    thread = threading.Thread(target=warm_cache, args=(queries,), name='dpd-cache-warmup', daemon=True)
+    thread.start()
+    return thread
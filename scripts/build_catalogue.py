@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Rebuild medschedule/data/catalogue.bin from medschedule/data/medications.csv.
+
+    python scripts/build_catalogue.py
+
+Run after editing the CSV and commit both files. The app also rebuilds a
+missing or stale binary on first load. If the package directory is
+read-only, it serves a stale binary with a warning, or builds a missing
+one in the temp directory.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from medschedule.catalogue import CATALOGUE_PATH, SOURCE_PATH, build_catalogue  # noqa: E402
+
+
+def main():
+    started = time.perf_counter()
+    rows = build_catalogue(SOURCE_PATH, CATALOGUE_PATH)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{rows} rows -> {CATALOGUE_PATH} ({os.path.getsize(CATALOGUE_PATH):,} bytes, {elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Dose guardrails: vectorized totals, units and per-ingredient sums."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from medschedule.guardrails import check_daily_limits, daily_doses, unit_factor  # noqa: E402
+from medschedule.schedule import get_dose_for_day  # noqa: E402
+
+TABLE = {'LEVOTHYROXINE': (300.0, 'mcg'), 'EMPAGLIFLOZIN': (25.0, 'mg'), 'ACETAMINOPHEN': (4000.0, 'mg')}
+
+
+def med(med_id, name, strength, unit='mg', slots=('Morning',), schedule=None):
+    return {
+        'id': med_id, 'name': name, 'strength_value': strength, 'strength_unit': unit,
+        'time_slots': list(slots), 'variable_dosing': schedule is not None, 'dose_schedule': schedule,
+    }
+
+
+def test_daily_doses_match_get_dose_for_day():
+    schedules = [
+        {'type': 'gradual', 'steps': [{'day': 0, 'dose': 40}, {'day': 7, 'dose': 30}, {'day': 14, 'dose': 20}]},
+        {'type': 'gradual', 'steps': [{'day': 3, 'dose': 10}, {'day': 10, 'dose': 5}]},
+        {'type': 'custom', 'ranges': [
+            {'start_day': 1, 'end_day': 5, 'dose': 50},
+            {'start_day': 4, 'end_day': 9, 'dose': 25},
+            {'start_day': 20, 'end_day': 25, 'dose': 12.5},
+        ]},
+    ]
+    for schedule in schedules:
+        entry = med('m', 'PREDNISONE', 15, schedule=schedule)
+        assert list(daily_doses(entry, 40)) == [get_dose_for_day(entry, day) for day in range(40)]
+
+
+def test_unit_factor_converts_mass_units_only():
+    assert unit_factor('mg', 'mcg') == 1000.0
+    assert unit_factor('mcg', 'mg') == 0.001
+    assert unit_factor('g', 'mg') == 1000.0
+    assert unit_factor('mL', 'mg') is None
+    assert unit_factor('tablet', 'tablet') == 1.0
+
+
+def test_mg_entry_is_checked_against_a_mcg_maximum():
+    violations = check_daily_limits([med('a', 'SYNTHROID', 0.2, slots=('Morning', 'Bedtime'))], days=5, table=TABLE)
+    assert [(v.ingredient, v.peak_total) for v in violations] == [('LEVOTHYROXINE', 400.0)]
+    assert check_daily_limits([med('a', 'SYNTHROID', 0.15, slots=('Morning', 'Bedtime'))], days=5, table=TABLE) == []
+
+
+def test_brand_and_generic_doses_add_up():
+    meds = [med('a', 'TYLENOL', 1000, slots=('Morning', 'Noon')), med('b', 'ACETAMINOPHEN', 1000, slots=('Evening', 'Bedtime'))]
+    assert check_daily_limits(meds, days=5, table=TABLE) == []
+    meds.append(med('c', 'Tylenol Extra Strength', 500))
+    violations = check_daily_limits(meds, days=5, table=TABLE)
+    assert [(v.ingredient, v.peak_total, v.med_ids) for v in violations] == [('ACETAMINOPHEN', 4500.0, ('a', 'b', 'c'))]
+
+
+def test_taper_flags_only_the_days_over_the_maximum():
+    schedule = {'type': 'gradual', 'steps': [{'day': 0, 'dose': 40}, {'day': 3, 'dose': 20}]}
+    violations = check_daily_limits([med('a', 'EMPAGLIFLOZIN', 40, schedule=schedule)], days=6, table=TABLE)
+    assert [v.days for v in violations] == [(0, 1, 2)]
+
+
+def test_jardiance_is_checked_as_empagliflozin():
+    violations = check_daily_limits([med('a', 'JARDIANCE', 25, slots=('Morning', 'Evening'))], days=3, table=TABLE)
+    assert [(v.ingredient, v.peak_total) for v in violations] == [('EMPAGLIFLOZIN', 50.0)]
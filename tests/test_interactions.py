@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Interaction screen and the brand/generic equivalence index it resolves names with."""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from medschedule.equivalents import find_duplicate_therapy, load_equivalence_index  # noqa: E402
+from medschedule.interactions import InteractionScreen, screen_medications  # noqa: E402
+
+NAMES = [
+    'WARFARIN', 'ASPIRIN', 'COUMADIN', 'ATIVAN', 'TYLENOL #3', 'PERCOCET', 'ZOLOFT', 'TRAMADOL',
+    'LIPITOR', 'CLARITHROMYCIN', 'SYNTHROID', 'CALCIUM CARBONATE', 'LITHIUM', 'IBUPROFEN', 'JARDIANCE',
+]
+
+
+def alert_set(alerts):
+    return {(a.severity, frozenset((a.first_id, a.second_id)), a.description) for a in alerts}
+
+
+def test_incremental_add_and_remove_match_a_full_screen():
+    rng = random.Random(7)
+    meds = [{'id': f"m{i}", 'name': rng.choice(NAMES)} for i in range(30)]
+    screen = InteractionScreen()
+    for entry in meds:
+        screen.add(entry)
+    assert alert_set(screen.alerts) == alert_set(screen_medications(meds))
+    assert screen.alerts
+
+    removed = rng.sample(meds, 10)
+    for entry in removed:
+        screen.remove(entry['id'])
+    remaining = [entry for entry in meds if entry not in removed]
+    assert alert_set(screen.alerts) == alert_set(screen_medications(remaining))
+
+
+def test_combination_products_screen_as_each_ingredient():
+    for name in ('TYLENOL #3', 'PERCOCET', 'CODEINE'):
+        alerts = screen_medications([{'id': '1', 'name': name}, {'id': '2', 'name': 'ATIVAN'}])
+        assert [a.severity for a in alerts] == ['major'], name
+
+
+def test_equivalents_resolve_brands_accents_and_generic_prefixes():
+    index = load_equivalence_index()
+    assert index.ingredients_of('JARDIANCE') == ('EMPAGLIFLOZIN',)
+    assert index.ingredients_of('SYNTHROID 0.1MG') == ('LEVOTHYROXINE',)
+    assert index.ingredients_of('Lévothyroxine') == ('LEVOTHYROXINE',)
+    assert index.ingredients_of('APO-TRAZODONE') == ('TRAZODONE',)
+    assert index.ingredients_of('PERCOCET') == ('OXYCODONE', 'ACETAMINOPHEN')
+    assert index.ingredients_of('NOT A DRUG') == ()
+    assert index.therapy_keys('not a drug') == ('NOT A DRUG',)
+
+
+def test_duplicate_therapy_across_brand_generic_and_combinations():
+    meds = [
+        {'id': 1, 'name': 'JARDIANCE'},
+        {'id': 2, 'name': 'EMPAGLIFLOZIN'},
+        {'id': 3, 'name': 'PERCOCET'},
+        {'id': 4, 'name': 'TYLENOL'},
+        {'id': 5, 'name': 'LIPITOR'},
+    ]
+    flags = find_duplicate_therapy(meds)
+    assert flags[1] == ('EMPAGLIFLOZIN', ('EMPAGLIFLOZIN',))
+    assert flags[3] == ('ACETAMINOPHEN', ('TYLENOL',))
+    assert flags[4] == ('ACETAMINOPHEN', ('PERCOCET',))
+    assert 5 not in flags
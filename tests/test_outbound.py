@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Regression tests for the outbound scheduler's wake-ups."""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from medschedule.outbound import OutboundScheduler  # noqa: E402
+
+
+def hold(scheduler, seconds, stop=None):
+    with scheduler.slot('burst', stop):
+        time.sleep(seconds)
+
+
+def test_slot_freed_while_bucket_is_empty_wakes_waiter():
+    # One slot, one token: the second request needs both the release and a refill (0.2 s)
+    scheduler = OutboundScheduler(rate=5, burst=1, max_concurrent=1)
+    first = threading.Thread(target=hold, args=(scheduler, 0.05))
+    first.start()
+    time.sleep(0.01)
+    started = time.monotonic()
+    hold(scheduler, 0, stop=time.monotonic() + 5)
+    first.join()
+    assert time.monotonic() - started < 1
+
+
+def test_waiter_without_deadline_is_not_stranded():
+    scheduler = OutboundScheduler(rate=5, burst=1, max_concurrent=1)
+    first = threading.Thread(target=hold, args=(scheduler, 0.05))
+    first.start()
+    time.sleep(0.01)
+    second = threading.Thread(target=hold, args=(scheduler, 0))
+    second.start()
+    second.join(timeout=2)
+    first.join()
+    assert not second.is_alive()
+
+
+def test_second_burst_after_busy_slots_is_served_promptly():
+    scheduler = OutboundScheduler(rate=20, burst=20, max_concurrent=8)
+    first = [threading.Thread(target=hold, args=(scheduler, 0.05)) for _ in range(12)]
+    for thread in first:
+        thread.start()
+    for thread in first:
+        thread.join()
+    started = time.monotonic()
+    second = [threading.Thread(target=hold, args=(scheduler, 0.05, time.monotonic() + 10)) for _ in range(16)]
+    for thread in second:
+        thread.start()
+    for thread in second:
+        thread.join()
+    assert time.monotonic() - started < 3
+    assert scheduler.stats()['timeouts'] == 0
+
+
+def test_timeout_withdraws_its_own_waiter_within_a_session():
+    # A (long deadline) and B (short) queue under one session behind a holder
+    scheduler = OutboundScheduler(rate=100, burst=100, max_concurrent=1)
+    holder = threading.Thread(target=hold, args=(scheduler, 0.5))
+    holder.start()
+    time.sleep(0.05)
+    outcome = {}
+
+    def request(name, deadline):
+        try:
+            with scheduler.slot('burst', time.monotonic() + deadline):
+                outcome[name] = 'served'
+        except TimeoutError:
+            outcome[name] = 'timeout'
+
+    a = threading.Thread(target=request, args=('a', 2))
+    a.start()
+    time.sleep(0.05)
+    request('b', 0.1)
+    a.join()
+    holder.join()
+    assert outcome == {'a': 'served', 'b': 'timeout'}
+    stats = scheduler.stats()
+    assert (stats['active'], stats['queued']) == (0, 0)
+    hold(scheduler, 0, stop=time.monotonic() + 1)